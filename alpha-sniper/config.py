@@ -5,6 +5,25 @@ from typing import Optional
 from dotenv import load_dotenv
 
 
+# Settings wired into long-lived objects at startup (exchange client, Telegram,
+# state file) or owned by the running bot (fast mode auto-disable).
+# A live reload keeps their current values; changing them needs a restart.
+RESTART_ONLY_SETTINGS = (
+    'sim_mode',
+    'sim_data_source',
+    'mexc_api_key',
+    'mexc_secret_key',
+    'telegram_bot_token',
+    'telegram_chat_id',
+    'positions_file_path',
+    'fast_mode_enabled',
+    'price_stream_enabled',
+    'ticker_fetch_concurrency',
+    'asyncio_debug_enabled',
+    'slow_callback_threshold_seconds',
+)
+
+
 @dataclass
 class PumpThresholds:
     """Regime-specific pump signal thresholds"""
@@ -158,6 +177,31 @@ class Config:
         # === PUMP DEBUG LOGGING ===
         self.pump_debug_logging = self.parse_bool(get_env("PUMP_DEBUG_LOGGING", "false"))
 
+        # === MARKET DATA CACHE ===
+        # Short-lived per-symbol caches so overlapping ticker/kline requests within a cycle share one REST call
+        self.ticker_cache_ttl_seconds = float(get_env("TICKER_CACHE_TTL_SECONDS", "3"))
+        self.klines_cache_max_ttl_seconds = float(get_env("KLINES_CACHE_MAX_TTL_SECONDS", "60"))  # capped at half a candle
+
+        # BTC regime is recomputed at most this often; cycles in between reuse the cached regime
+        self.regime_update_interval_seconds = int(get_env("REGIME_UPDATE_INTERVAL_SECONDS", "3600"))
+
+        # Exchange market metadata cached on disk so restarts skip the full load_markets download
+        self.markets_cache_path = get_env("MARKETS_CACHE_PATH", "/var/lib/alpha-sniper/mexc_markets.json")
+        self.markets_cache_ttl_hours = float(get_env("MARKETS_CACHE_TTL_HOURS", "24"))
+
+        # Max concurrent per-symbol ticker requests when the exchange has no batch endpoint
+        # Keep below exchange.HTTP_POOL_MAXSIZE and within MEXC's per-IP rate limit
+        self.ticker_fetch_concurrency = max(1, int(get_env("TICKER_FETCH_CONCURRENCY", "8")))
+        # Per-request cap on position-loop price/kline fetches; a symbol that stalls past it
+        # is skipped for this tick instead of holding up every other position's check
+        self.ticker_fetch_timeout_seconds = float(get_env("TICKER_FETCH_TIMEOUT_SECONDS", "5"))
+
+        # === PRICE STREAM ===
+        # WebSocket ticker stream for open positions (MEXC data only; SIM FAKE data polls)
+        self.price_stream_enabled = self.parse_bool(get_env("PRICE_STREAM_ENABLED", "false"))
+        # Streamed prices older than this are ignored and the position loop polls REST instead
+        self.price_stream_max_stale_seconds = float(get_env("PRICE_STREAM_MAX_STALE_SECONDS", "5"))
+
         # === POSITIONS FILE PATH ===
         self.positions_file_path = get_env("POSITIONS_FILE_PATH", "/var/lib/alpha-sniper/positions.json")
 
@@ -168,6 +212,10 @@ class Config:
         # === DRIFT DETECTION ===
         self.drift_detection_enabled = self.parse_bool(get_env("DRIFT_DETECTION_ENABLED", "true"))
         self.drift_max_stall_multiplier = int(get_env("DRIFT_MAX_STALL_MULTIPLIER", "3"))  # max(3 * scan_interval, 600s)
+        # asyncio debug mode: logs any callback/task step that blocks the event loop longer
+        # than the threshold (catches blocking I/O long before drift detection would)
+        self.asyncio_debug_enabled = self.parse_bool(get_env("ASYNCIO_DEBUG_ENABLED", "false"))
+        self.slow_callback_threshold_seconds = float(get_env("SLOW_CALLBACK_THRESHOLD_SECONDS", "0.2"))
 
         if not self.sim_mode:
             if not self.mexc_api_key or not self.mexc_secret_key:
@@ -307,6 +355,27 @@ class Config:
             new_listing_min_momentum=get_threshold('new_listing_min_momentum', defaults['new_listing_min_momentum']),
         )
 
+    def reload(self) -> list:
+        """
+        Re-read .env and the environment into this instance (SIGHUP reload)
+        Updated in place, so every component holding this config sees the new values.
+        RESTART_ONLY_SETTINGS keep their running values.
+        Raises (leaving this instance untouched) if the new configuration is invalid.
+
+        Returns: names of restart-only settings whose new value was not applied
+        """
+        load_dotenv(override=True)
+        fresh = Config()
+
+        skipped = []
+        for name in RESTART_ONLY_SETTINGS:
+            if getattr(fresh, name) != getattr(self, name):
+                skipped.append(name)
+            setattr(fresh, name, getattr(self, name))
+
+        self.__dict__.update(vars(fresh))
+        return skipped
+
     @staticmethod
     def parse_bool(value):
         if isinstance(value, bool):
@@ -2,17 +2,135 @@
 Exchange wrapper for Alpha Sniper V4.2
 Supports both Real (MEXC) and Simulated modes
 
+Class layout:
+- BaseExchange: interface
+- SimulatedExchange: synthetic data (SIM_DATA_SOURCE=FAKE)
+- MexcExchange: shared ccxt client, retries, caches and market data
+  - RealExchange: LIVE trading
+  - DataOnlyMexcExchange: real data, paper orders
+
 IMPROVEMENTS:
 - Enhanced _with_retries with funding-rate spam suppression
 - Clean BaseExchange interface
 - Robust error handling with exponential backoff
 """
 import ccxt
+import os
 import time
 import logging
 import random
+import threading
+import requests
 import numpy as np
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+
+from utils import helpers
+
+
+# HTTP connection pool for MEXC
+# Position tickers are fetched concurrently from worker threads, so the pool has to
+# hold more than urllib3's default of 10 sockets or warm connections get discarded
+HTTP_POOL_CONNECTIONS = 20
+HTTP_POOL_MAXSIZE = 40
+
+
+def _create_http_session() -> requests.Session:
+    """
+    Build a keep-alive HTTP session with a bounded connection pool
+    Injected into the ccxt client so repeat calls reuse warm TLS connections
+    """
+    session = requests.Session()
+    session.trust_env = False  # Same as ccxt's default session
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=0  # Retries are handled by _with_retries
+    )
+    session.mount('https://', adapter)
+    session.headers.update({'Connection': 'keep-alive'})
+    return session
+
+
+class _ThreadSafeMexc(ccxt.mexc):
+    """
+    ccxt MEXC client that can be shared by worker threads
+
+    The sync ccxt client is not thread-safe: throttle() reads lastRestRequestTimestamp
+    and it is only written back once the request goes out, so threads throttling at
+    the same time all compute the same delay and then fire together. Here each
+    request reserves its send slot under a lock (rateLimit * cost apart), while the
+    HTTP round-trips themselves still overlap.
+
+    last_response_headers is shared too; the headers of the response the *current
+    thread* received are kept in thread_response_headers (used for Retry-After).
+    """
+    def __init__(self, config=None):
+        # Set before ccxt's __init__, which reads every attribute (properties included)
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = 0.0  # monotonic seconds
+        self._thread_state = threading.local()
+        super().__init__(config or {})
+
+    def throttle(self, cost=None):
+        interval = self.rateLimit * (1 if cost is None else cost) / 1000.0
+        with self._throttle_lock:
+            now = time.monotonic()
+            send_at = max(now, self._next_request_at)
+            self._next_request_at = send_at + interval
+        if send_at > now:
+            time.sleep(send_at - now)
+
+    def on_rest_response(self, code, reason, url, method, response_headers, response_body, request_headers, request_body):
+        self._thread_state.headers = response_headers
+        return super().on_rest_response(code, reason, url, method, response_headers, response_body, request_headers, request_body)
+
+    @property
+    def thread_response_headers(self):
+        """Headers of the last REST response received by the calling thread"""
+        return getattr(self._thread_state, 'headers', None)
+
+
+# Candle length per timeframe, used to derive kline cache TTLs
+TIMEFRAME_SECONDS = {
+    '1m': 60, '5m': 300, '15m': 900, '30m': 1800,
+    '1h': 3600, '4h': 14400, '1d': 86400
+}
+
+# Size cap per market data cache; least-recently-used entries are evicted past it
+MARKET_DATA_CACHE_MAX_ENTRIES = 4096
+
+# Upper bound for any single retry sleep (rate limits included)
+RETRY_MAX_BACKOFF_SECONDS = 30
+
+# After a failed TTL refresh of the market list, keep the old markets and retry this much later
+MARKETS_REFRESH_RETRY_SECONDS = 900
+
+
+def _retry_backoff(client, error: Exception, attempt: int, delay_sec: float) -> float:
+    """
+    Seconds to wait before the next retry attempt
+
+    - Rate limits (ccxt DDoSProtection / RateLimitExceeded): honour the server's
+      Retry-After header when present, else min(2**attempt, 30)s plus jitter
+    - Everything else: delay_sec * 2**attempt plus jitter, so transient
+      TCP resets recover quickly without retrying in lockstep
+    """
+    jitter = random.uniform(0, 0.5)
+
+    if isinstance(error, (ccxt.DDoSProtection, ccxt.RateLimitExceeded)):
+        # Per-thread headers: concurrent requests must not see each other's Retry-After
+        headers = getattr(client, 'thread_response_headers', None) or {}
+        retry_after = headers.get('Retry-After')
+        if retry_after:
+            try:
+                return min(float(retry_after), RETRY_MAX_BACKOFF_SECONDS)
+            except (TypeError, ValueError):
+                pass  # HTTP-date form, fall through to exponential backoff
+        return min(2 ** attempt, RETRY_MAX_BACKOFF_SECONDS) + jitter
+
+    return min(delay_sec * (2 ** attempt), RETRY_MAX_BACKOFF_SECONDS) + jitter
 
 
 class BaseExchange:
@@ -28,6 +146,46 @@ class BaseExchange:
     def get_ticker(self, symbol: str):
         raise NotImplementedError
 
+    def get_tickers(self, symbols: list) -> dict:
+        """
+        Fetch tickers for several symbols
+        Default: one get_ticker call per symbol. Exchanges with a batch
+        endpoint override this and report has_batch_tickers() = True.
+        Returns: dict {symbol -> ticker} (symbols that failed are omitted)
+        """
+        tickers = {}
+        for symbol in symbols:
+            ticker = self.get_ticker(symbol)
+            if ticker:
+                tickers[symbol] = ticker
+        return tickers
+
+    def has_batch_tickers(self) -> bool:
+        """True if get_tickers costs a single request regardless of symbol count"""
+        return False
+
+    def get_last_prices(self, symbols: list) -> dict:
+        """
+        Last price for several symbols
+        Default: taken from get_tickers. Exchanges with a lighter price-only
+        endpoint override this.
+        Returns: dict {symbol -> last price} (symbols that failed are omitted)
+        """
+        prices = {}
+        for symbol, ticker in self.get_tickers(symbols).items():
+            price = ticker.get('last') or ticker.get('close')
+            if price:
+                prices[symbol] = price
+        return prices
+
+    def cache_stats(self) -> dict:
+        """Market data cache counters (empty if the exchange doesn't cache)"""
+        return {}
+
+    def clear_market_data_cache(self):
+        """Drop cached market data (no-op if the exchange doesn't cache)"""
+        pass
+
     def get_last_price(self, symbol: str):
         raise NotImplementedError
 
@@ -409,35 +567,196 @@ class SimulatedExchange(BaseExchange):
         }
 
 
-class RealExchange(BaseExchange):
+class MexcExchange(BaseExchange):
     """
-    Real exchange wrapper for LIVE mode
-    Uses actual MEXC via ccxt
+    Shared MEXC market-data layer on top of ccxt
+    Owns the client, retry policy and market-data caches used by both
+    RealExchange (LIVE) and DataOnlyMexcExchange (SIM with LIVE_DATA)
 
     IMPROVEMENTS:
     - Enhanced _with_retries with funding-rate spam suppression
     - Exponential backoff retry strategy
     - Clean error handling without log flooding
     """
-    def __init__(self, config, logger):
+    def __init__(self, config, logger, client_params: dict = None):
         self.config = config
         self.logger = logger
 
-        if not config.mexc_api_key or not config.mexc_secret_key:
-            raise Exception("LIVE mode requires MEXC_API_KEY and MEXC_SECRET_KEY")
-
-        self.client = ccxt.mexc({
-            'apiKey': config.mexc_api_key,
-            'secret': config.mexc_secret_key,
+        # Shared by the scanner thread and the concurrent ticker/kline fetches
+        self.client = _ThreadSafeMexc({
             'timeout': 5000,  # 5s timeout to prevent scan loop stalling
             'enableRateLimit': True,
+            'session': _create_http_session(),
+            **(client_params or {})
         })
 
-        self.logger.info("🌐 RealExchange initialized (LIVE mode with MEXC)")
+        self._init_market_data_cache()
+        # Monotonic time the client's markets were loaded (None until first load)
+        self._markets_loaded_at = None
+
+    # === MARKET DATA CACHE ===
+
+    def _init_market_data_cache(self):
+        """
+        Per-symbol TTL + LRU caches for tickers and klines
+        Scanner, position management and Entry-DETE request overlapping symbols
+        within one cycle; cache hits skip the REST round-trip entirely.
+        Tickers are also written from worker threads, hence the lock.
+        """
+        self._ticker_cache = OrderedDict()  # symbol -> (expires_at, ticker)
+        self._kline_cache = OrderedDict()  # (symbol, timeframe) -> (expires_at, ohlcv)
+        self._cache_lock = threading.Lock()
+        self._cache_hits = {'ticker': 0, 'klines': 0}
+        self._cache_misses = {'ticker': 0, 'klines': 0}
+
+    def _kline_cache_ttl(self, timeframe: str) -> float:
+        """Half a candle, capped by KLINES_CACHE_MAX_TTL_SECONDS"""
+        candle_seconds = TIMEFRAME_SECONDS.get(timeframe, 60)
+        return min(candle_seconds / 2, self.config.klines_cache_max_ttl_seconds)
+
+    def _cache_get(self, cache: OrderedDict, key, now: float):
+        """Return the live cache entry for key (refreshing its LRU position), or None"""
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                del cache[key]
+                return None
+            cache.move_to_end(key)
+            return entry[1]
+
+    def _cache_put(self, cache: OrderedDict, key, value, expires_at: float):
+        """Store value under key, evicting least-recently-used entries past the size cap"""
+        with self._cache_lock:
+            cache[key] = (expires_at, value)
+            cache.move_to_end(key)
+            while len(cache) > MARKET_DATA_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+
+    def _count_cache(self, kind: str, hit: bool):
+        (self._cache_hits if hit else self._cache_misses)[kind] += 1
+
+    def _cached_ticker(self, symbol: str, fetch):
+        """Return a fresh cached ticker for symbol, or call fetch() and cache the result"""
+        ttl = self.config.ticker_cache_ttl_seconds
+        now = time.monotonic()
+
+        ticker = self._cache_get(self._ticker_cache, symbol, now)
+        self._count_cache('ticker', ticker is not None)
+        if ticker is not None:
+            return ticker
+
+        ticker = fetch()
+        if ticker and ttl > 0:
+            self._cache_put(self._ticker_cache, symbol, ticker, now + ttl)
+        return ticker
+
+    def _cached_klines(self, symbol: str, timeframe: str, limit: int, fetch):
+        """
+        Return cached klines for (symbol, timeframe), or call fetch() and cache the result
+        A cached series with at least `limit` candles also serves smaller requests.
+        """
+        ttl = self._kline_cache_ttl(timeframe)
+        now = time.monotonic()
+        key = (symbol, timeframe)
+
+        ohlcv = self._cache_get(self._kline_cache, key, now)
+        hit = ohlcv is not None and len(ohlcv) >= limit
+        self._count_cache('klines', hit)
+        if hit:
+            return ohlcv[-limit:]
+
+        ohlcv = fetch()
+        if ohlcv and ttl > 0:
+            self._cache_put(self._kline_cache, key, ohlcv, now + ttl)
+        return ohlcv
 
-    def _with_retries(self, func, label: str, max_attempts: int = 2, delay_sec: float = 1.0):
+    def cache_stats(self) -> dict:
+        """Hit/miss counters and current size per market data cache"""
+        stats = {}
+        for kind, cache in (('ticker', self._ticker_cache), ('klines', self._kline_cache)):
+            hits, misses = self._cache_hits[kind], self._cache_misses[kind]
+            total = hits + misses
+            stats[kind] = {
+                'size': len(cache),
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': hits / total if total else 0.0
+            }
+        return stats
+
+    def clear_market_data_cache(self):
+        """Drop all cached tickers and klines (counters are kept)"""
+        with self._cache_lock:
+            self._ticker_cache.clear()
+            self._kline_cache.clear()
+
+    def _load_markets_cached(self):
+        """
+        Load markets for a ccxt-backed exchange, preferring the on-disk cache
+        Cold starts hydrate the client from MARKETS_CACHE_PATH (if younger than
+        MARKETS_CACHE_TTL_HOURS) instead of downloading the full market list;
+        the cache file is rewritten after every network load.
+        In-process, markets are reused for the same TTL and then reloaded so a
+        long-running bot picks up listings/delistings.
         """
-        Retry wrapper for network calls with exponential backoff
+        max_age_seconds = self.config.markets_cache_ttl_hours * 3600
+
+        if self.client.markets:
+            if self._markets_loaded_at is None:
+                # Loaded implicitly by a ccxt call - start the TTL from here
+                self._markets_loaded_at = time.monotonic()
+            if time.monotonic() - self._markets_loaded_at < max_age_seconds:
+                return self.client.markets
+
+        cache_path = self.config.markets_cache_path
+
+        if cache_path and os.path.exists(cache_path):
+            try:
+                cache_age = time.time() - os.path.getmtime(cache_path)
+                if cache_age < max_age_seconds:
+                    cached = helpers.load_json(cache_path, default={})
+                    if cached.get('markets'):
+                        self.client.set_markets(cached['markets'], cached.get('currencies'))
+                        self._markets_loaded_at = time.monotonic() - max(cache_age, 0.0)
+                        self.logger.info(f"📂 Loaded {len(self.client.markets)} markets from cache ({cache_path})")
+                        return self.client.markets
+            except Exception as e:
+                self.logger.debug(f"Ignoring markets cache {cache_path}: {e}")
+
+        reload = bool(self.client.markets)
+        markets = self._with_retries(lambda: self.client.load_markets(reload=reload), "load_markets")
+
+        if not markets:
+            # Refresh failed - keep trading on the markets we already have and back off,
+            # otherwise every scan would retry load_markets until it succeeds
+            if self.client.markets:
+                retry_in = min(MARKETS_REFRESH_RETRY_SECONDS, max_age_seconds)
+                self._markets_loaded_at = time.monotonic() - max_age_seconds + retry_in
+                self.logger.warning(f"⚠️ Markets refresh failed, keeping current markets (retry in {retry_in / 60:.0f} min)")
+            return self.client.markets
+
+        self._markets_loaded_at = time.monotonic()
+        if reload:
+            self.logger.info(f"🔄 Refreshed {len(markets)} markets (older than {self.config.markets_cache_ttl_hours:g}h)")
+
+        if cache_path:
+            try:
+                helpers.save_json_atomic(cache_path, {
+                    'markets': markets,
+                    'currencies': self.client.currencies
+                })
+            except Exception as e:
+                self.logger.debug(f"Could not write markets cache {cache_path}: {e}")
+
+        return markets
+
+    # === MARKET DATA (shared by LIVE and LIVE_DATA) ===
+
+    def _with_retries(self, func, label: str, max_attempts: int = 2, delay_sec: float = 0.25):
+        """
+        Retry wrapper for network calls with jittered exponential backoff
 
         SPAM SUPPRESSION FOR FUNDING RATE ERRORS:
         - If label contains "fetch_funding_rate" or "fetch_funding_rate_history"
@@ -450,7 +769,7 @@ class RealExchange(BaseExchange):
             func: Function to call
             label: Description for logging
             max_attempts: Max retry attempts (default: 2, reduced from 3 to fail-fast)
-            delay_sec: Initial delay between retries (default: 1.0s, reduced from 2.0s)
+            delay_sec: Base delay for non-rate-limit errors (default: 0.25s, plus jitter)
 
         Returns:
             Result from func(), or None on failure (fail-safe: scan continues)
@@ -473,7 +792,7 @@ class RealExchange(BaseExchange):
                 if is_funding_call and is_contract_error:
                     # Extract symbol from label if available
                     symbol_part = label.replace('fetch_funding_rate', '').replace('fetch_funding_rate_history', '').strip()
-                    self.logger.debug(f"Skipping funding rate for {symbol_part}: contract does not exist on exchange (code 1001)")
+                    self.logger.debug("Skipping funding rate for %s: contract does not exist on exchange (code 1001)", symbol_part)
                     return None  # Return immediately, no retries, no ERROR logs
 
                 # === NORMAL ERROR HANDLING ===
@@ -481,9 +800,9 @@ class RealExchange(BaseExchange):
                 self.logger.error(f"Error on attempt {attempt + 1}/{max_attempts}: {label} - {error_repr}")
 
                 if attempt < max_attempts - 1:
-                    # Exponential backoff: 1s (fail-fast to prevent scan loop stalling)
-                    backoff = delay_sec * (2 ** attempt)
-                    self.logger.debug(f"Retrying after {backoff:.1f}s...")
+                    # Exponential backoff with jitter; rate limits honour Retry-After
+                    backoff = _retry_backoff(self.client, e, attempt, delay_sec)
+                    self.logger.debug(f"Retrying after {backoff:.2f}s...")
                     time.sleep(backoff)
 
         # Max retries exceeded
@@ -491,19 +810,154 @@ class RealExchange(BaseExchange):
         return None
 
     def get_markets(self):
-        """Load markets from MEXC"""
-        return self._with_retries(lambda: self.client.load_markets(), "load_markets")
+        """Load markets from MEXC (disk-cached across restarts)"""
+        return self._load_markets_cached()
 
     def get_klines(self, symbol: str, timeframe: str, limit: int = 200):
-        """Fetch OHLCV from MEXC"""
-        return self._with_retries(
-            lambda: self.client.fetch_ohlcv(symbol, timeframe, limit=limit),
+        """Fetch OHLCV from MEXC (TTL-cached)"""
+        return self._cached_klines(symbol, timeframe, limit, lambda: self._with_retries(
+            lambda: self._fetch_klines_raw(symbol, timeframe, limit),
             f"fetch_ohlcv {symbol} {timeframe}"
-        )
+        ))
+
+    def _fetch_klines_raw(self, symbol: str, timeframe: str, limit: int):
+        """
+        Spot klines straight from GET /api/v3/klines
+
+        Goes through ccxt's implicit endpoint (same session, rate limiter and
+        error mapping) but skips fetch_ohlcv's per-row normalization: the
+        string columns are converted in one numpy pass instead.
+        Falls back to fetch_ohlcv for anything the raw path can't handle.
+        """
+        market = self.client.markets.get(symbol) if self.client.markets else None
+        interval = self.client.options.get('timeframes', {}).get('spot', {}).get(timeframe)
+        if not market or not market.get('spot') or not interval:
+            return self.client.fetch_ohlcv(symbol, timeframe, limit=limit)
+
+        rows = self.client.spotPublicGetKlines({
+            'symbol': market['id'],
+            'interval': interval,
+            'limit': limit
+        })
+        if not rows:
+            return []
+
+        # [openTime, open, high, low, close, volume, closeTime, quoteVolume] -> OHLCV
+        ohlcv = np.asarray([row[:6] for row in rows], dtype=np.float64).tolist()
+        for candle in ohlcv:
+            candle[0] = int(candle[0])
+        return ohlcv
 
     def get_ticker(self, symbol: str):
-        """Fetch ticker from MEXC"""
-        return self._with_retries(lambda: self.client.fetch_ticker(symbol), f"fetch_ticker {symbol}")
+        """Fetch ticker from MEXC (TTL-cached)"""
+        return self._cached_ticker(symbol, lambda: self._with_retries(
+            lambda: self.client.fetch_ticker(symbol),
+            f"fetch_ticker {symbol}"
+        ))
+
+    def has_batch_tickers(self) -> bool:
+        """MEXC exposes fetch_tickers (one request for many symbols)"""
+        return bool(self.client.has.get('fetchTickers'))
+
+    def get_tickers(self, symbols: list) -> dict:
+        """
+        Fetch tickers for many symbols in one request via fetch_tickers
+        Fresh cache entries are served locally; only the rest hit the network.
+        Falls back to per-symbol fetches if the batch endpoint is unsupported or fails.
+        Returns: dict {symbol -> ticker} (symbols that failed are omitted)
+        """
+        now = time.monotonic()
+        tickers = {}
+        missing = []
+        for symbol in symbols:
+            ticker = self._cache_get(self._ticker_cache, symbol, now)
+            self._count_cache('ticker', ticker is not None)
+            if ticker is not None:
+                tickers[symbol] = ticker
+            else:
+                missing.append(symbol)
+
+        if not missing:
+            return tickers
+
+        if not self.has_batch_tickers():
+            tickers.update(super().get_tickers(missing))
+            return tickers
+
+        fetched = self._with_retries(
+            lambda: self.client.fetch_tickers(missing),
+            f"fetch_tickers ({len(missing)} symbols)"
+        )
+        if fetched is None:
+            tickers.update(super().get_tickers(missing))
+            return tickers
+
+        ttl = self.config.ticker_cache_ttl_seconds
+        expires_at = time.monotonic() + ttl
+        for symbol in missing:
+            ticker = fetched.get(symbol)
+            if not ticker:
+                continue
+            tickers[symbol] = ticker
+            if ttl > 0:
+                self._cache_put(self._ticker_cache, symbol, ticker, expires_at)
+
+        return tickers
+
+    def get_last_prices(self, symbols: list) -> dict:
+        """
+        Last price for many symbols via GET /api/v3/ticker/price (one request)
+        For more than one symbol ccxt's fetch_tickers pulls the 24h ticker of
+        EVERY market (request weight 40); ticker/price returns only symbol and
+        price (weight 2, or 1 for a single symbol). Fresh ticker-cache entries
+        are served locally; non-spot symbols and failures fall back to get_tickers.
+        Returns: dict {symbol -> last price} (symbols that failed are omitted)
+        """
+        now = time.monotonic()
+        markets = self.client.markets or {}
+        prices = {}
+        symbol_by_id = {}
+        fallback = []
+        for symbol in symbols:
+            ticker = self._cache_get(self._ticker_cache, symbol, now)
+            if ticker is not None and ticker.get('last'):
+                self._count_cache('ticker', True)
+                prices[symbol] = ticker['last']
+                continue
+
+            market = markets.get(symbol)
+            if market and market.get('spot'):
+                self._count_cache('ticker', False)
+                symbol_by_id[market['id']] = symbol
+            else:
+                fallback.append(symbol)  # counted by get_tickers
+
+        if symbol_by_id:
+            request = {'symbol': next(iter(symbol_by_id))} if len(symbol_by_id) == 1 else {}
+            response = self._with_retries(
+                lambda: self.client.spotPublicGetTickerPrice(request),
+                f"ticker_price ({len(symbol_by_id)} symbols)"
+            )
+            if isinstance(response, dict):
+                response = [response]
+
+            for row in response or []:
+                symbol = symbol_by_id.get(row.get('symbol'))
+                if symbol is None:
+                    continue
+                try:
+                    price = float(row['price'])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if price > 0:
+                    prices[symbol] = price
+
+            fallback.extend(symbol for symbol in symbol_by_id.values() if symbol not in prices)
+
+        if fallback:
+            prices.update(super().get_last_prices(fallback))
+
+        return prices
 
     def get_last_price(self, symbol: str):
         """Get latest price for Fast Stop Manager"""
@@ -531,7 +985,7 @@ class RealExchange(BaseExchange):
                 return funding.get('fundingRate', 0)
         except Exception as e:
             # This catch is for any errors NOT caught by _with_retries
-            self.logger.debug(f"Unexpected error fetching funding rate for {symbol}: {e}")
+            self.logger.debug("Unexpected error fetching funding rate for %s: %s", symbol, e)
         return 0
 
     def get_liquidity_metrics(self, symbol: str):
@@ -570,9 +1024,26 @@ class RealExchange(BaseExchange):
             }
 
         except Exception as e:
-            self.logger.debug(f"Error getting liquidity metrics for {symbol}: {e}")
+            self.logger.debug("Error getting liquidity metrics for %s: %s", symbol, e)
             return {'spread_pct': 1.0, 'depth_usd': 5000}
 
+
+class RealExchange(MexcExchange):
+    """
+    Real exchange wrapper for LIVE mode
+    Uses actual MEXC via ccxt (authenticated client)
+    """
+    def __init__(self, config, logger):
+        if not config.mexc_api_key or not config.mexc_secret_key:
+            raise Exception("LIVE mode requires MEXC_API_KEY and MEXC_SECRET_KEY")
+
+        super().__init__(config, logger, {
+            'apiKey': config.mexc_api_key,
+            'secret': config.mexc_secret_key,
+        })
+
+        self.logger.info("🌐 RealExchange initialized (LIVE mode with MEXC)")
+
     def create_order(self, symbol, type, side, amount, price=None, params=None):
         """Create real order on MEXC"""
         return self._with_retries(
@@ -649,108 +1120,18 @@ class RealExchange(BaseExchange):
             return None
 
 
-class DataOnlyMexcExchange(BaseExchange):
+class DataOnlyMexcExchange(MexcExchange):
     """
     Data-only exchange for SIM mode with LIVE_DATA
     Uses real MEXC market data via public API (no authentication)
     Does NOT place real orders - for paper trading only
-
-    IMPROVEMENTS:
-    - Enhanced _with_retries with funding-rate spam suppression
-    - Exponential backoff retry strategy
-    - Clean error handling without log flooding
     """
     def __init__(self, config, logger):
-        self.config = config
-        self.logger = logger
-
-        # Initialize MEXC client in public mode (no API keys required)
-        self.client = ccxt.mexc({
-            'timeout': 5000,  # 5s timeout to prevent scan loop stalling
-            'enableRateLimit': True,
-        })
+        # MEXC client in public mode (no API keys required)
+        super().__init__(config, logger)
 
         self.logger.info("🌐 DataOnlyMexcExchange initialized (REAL MEXC data, PAPER trading only)")
 
-    def _with_retries(self, func, label: str, max_attempts: int = 2, delay_sec: float = 1.0):
-        """
-        Retry wrapper for network calls with exponential backoff
-
-        SPAM SUPPRESSION FOR FUNDING RATE ERRORS:
-        - If label contains "fetch_funding_rate" or "fetch_funding_rate_history"
-          AND the exception contains both "Contract does not exist" AND code 1001:
-            - Log exactly one debug line
-            - Return None immediately (no retries, no ERROR logs)
-        - For all other errors: normal retry behavior with ERROR logging
-
-        Args:
-            func: Function to call
-            label: Description for logging
-            max_attempts: Max retry attempts (default: 2, reduced from 3 to fail-fast)
-            delay_sec: Initial delay between retries (default: 1.0s, reduced from 2.0s)
-
-        Returns:
-            Result from func(), or None on failure (fail-safe: scan continues)
-        """
-        for attempt in range(max_attempts):
-            try:
-                return func()
-            except Exception as e:
-                error_str = str(e)
-                error_repr = repr(e)
-
-                # === FUNDING RATE SPAM SUPPRESSION ===
-                # Check if this is a funding rate call with "contract does not exist" error
-                is_funding_call = 'fetch_funding_rate' in label.lower()
-                # Check for both "Contract does not exist" message and code 1001 (with various JSON formatting)
-                has_contract_error_msg = 'Contract does not exist' in error_str or 'Contract does not exist' in error_repr
-                has_code_1001 = ('code":1001' in error_repr or 'code": 1001' in error_repr or 'code:1001' in error_repr)
-                is_contract_error = has_contract_error_msg and has_code_1001
-
-                if is_funding_call and is_contract_error:
-                    # Extract symbol from label if available
-                    symbol_part = label.replace('fetch_funding_rate', '').replace('fetch_funding_rate_history', '').strip()
-                    self.logger.debug(f"Skipping funding rate for {symbol_part}: contract does not exist on exchange (code 1001)")
-                    return None  # Return immediately, no retries, no ERROR logs
-
-                # === NORMAL ERROR HANDLING ===
-                # Log error for non-funding-rate calls or different errors
-                self.logger.error(f"Error on attempt {attempt + 1}/{max_attempts}: {label} - {error_repr}")
-
-                if attempt < max_attempts - 1:
-                    # Exponential backoff: 1s (fail-fast to prevent scan loop stalling)
-                    backoff = delay_sec * (2 ** attempt)
-                    self.logger.debug(f"Retrying after {backoff:.1f}s...")
-                    time.sleep(backoff)
-
-        # Max retries exceeded
-        self.logger.error(f"Max retries exceeded for: {label}")
-        return None
-
-    def get_markets(self):
-        """Load markets from MEXC (public endpoint)"""
-        return self._with_retries(lambda: self.client.load_markets(), "load_markets")
-
-    def get_klines(self, symbol: str, timeframe: str, limit: int = 200):
-        """Fetch OHLCV from MEXC (public endpoint)"""
-        return self._with_retries(
-            lambda: self.client.fetch_ohlcv(symbol, timeframe, limit=limit),
-            f"fetch_ohlcv {symbol} {timeframe}"
-        )
-
-    def get_ticker(self, symbol: str):
-        """Fetch ticker from MEXC (public endpoint)"""
-        return self._with_retries(lambda: self.client.fetch_ticker(symbol), f"fetch_ticker {symbol}")
-
-    def get_last_price(self, symbol: str):
-        """Get latest price for Fast Stop Manager"""
-        ticker = self.get_ticker(symbol)
-        return ticker['last'] if ticker else None
-
-    def get_orderbook(self, symbol: str):
-        """Fetch orderbook from MEXC (public endpoint)"""
-        return self._with_retries(lambda: self.client.fetch_order_book(symbol), f"fetch_orderbook {symbol}")
-
     def get_funding_rate(self, symbol: str) -> float:
         """
         Fetch real MEXC futures funding rate (8h) for a given symbol.
@@ -777,15 +1158,14 @@ class DataOnlyMexcExchange(BaseExchange):
             contract_symbol = symbol.replace('/', '_')
 
             # Use MEXC contract API directly (more reliable than CCXT for funding)
-            import requests
-
+            # Goes through the client's pooled session to reuse warm connections
             url = "https://contract.mexc.com/api/v1/contract/funding_rate/" + contract_symbol
 
             # Wrap in _with_retries for consistency and spam suppression
             def fetch_funding():
-                response = requests.get(url, timeout=5)
+                response = self.client.session.get(url, timeout=5)
                 if response.status_code == 200:
-                    data = response.json()
+                    data = helpers.loads_json(response.content)
                     if data and 'data' in data and data['data']:
                         rate = float(data['data'].get('fundingRate', 0))
                         return rate
@@ -797,7 +1177,7 @@ class DataOnlyMexcExchange(BaseExchange):
 
             rate = self._with_retries(fetch_funding, f"fetch_funding_rate {symbol}")
             if rate is not None:
-                self.logger.debug(f"[Funding] {symbol} | funding_8h={rate:.6f}")
+                self.logger.debug("[Funding] %s | funding_8h=%.6f", symbol, rate)
                 return rate
             else:
                 return 0.0
@@ -806,44 +1186,6 @@ class DataOnlyMexcExchange(BaseExchange):
             self.logger.debug(f"[Funding] Failed to fetch funding for {symbol}, defaulting to 0.0: {e}")
             return 0.0
 
-    def get_liquidity_metrics(self, symbol: str):
-        """
-        === UPGRADE D: Liquidity-Aware Position Sizing ===
-        Calculate liquidity metrics from real orderbook data
-        """
-        try:
-            ticker = self.get_ticker(symbol)
-            orderbook = self.get_orderbook(symbol)
-
-            if not ticker or not orderbook:
-                return {'spread_pct': 1.0, 'depth_usd': 5000}
-
-            # Calculate spread
-            bid = ticker.get('bid', 0)
-            ask = ticker.get('ask', 0)
-            last = ticker.get('last', 1)
-
-            spread_pct = ((ask - bid) / last) * 100 if last > 0 and bid > 0 and ask > 0 else 0.5
-
-            # Calculate depth (sum of top 10 bid/ask levels)
-            depth_usd = 0
-            bids = orderbook.get('bids', [])[:10]
-            asks = orderbook.get('asks', [])[:10]
-
-            for price, amount in bids:
-                depth_usd += price * amount
-
-            for price, amount in asks:
-                depth_usd += price * amount
-
-            return {
-                'spread_pct': spread_pct,
-                'depth_usd': depth_usd
-            }
-        except Exception as e:
-            self.logger.debug(f"Error getting liquidity metrics for {symbol}: {e}")
-            return {'spread_pct': 1.0, 'depth_usd': 5000}
-
     # === PAPER TRADING METHODS (No real orders) ===
 
     def create_order(self, symbol, type, side, amount, price=None, params=None):
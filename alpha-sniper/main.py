@@ -11,26 +11,65 @@ Features:
 - Fast Stop Manager (dual async loops)
 """
 import time
-import schedule
 import signal
 import sys
 import argparse
 import asyncio
-from datetime import datetime, timezone
+import functools
+import html
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
 
 from config import get_config
 from utils import setup_logger
 from utils.dynamic_filters import update_dynamic_filters
 from utils.entry_dete import EntryDETEngine
+from utils.price_book import PriceBook
 from utils.pump_trailer import PumpTrailer
 from utils.telegram import TelegramNotifier
 from utils.telegram_alerts import TelegramAlertManager
 from utils import helpers
-from exchange import create_exchange
+from exchange import create_exchange, MexcExchange
 from risk_engine import RiskEngine
 from signals.scanner import Scanner
 
 
+# Log banners (startup header and per-cycle header)
+_STARTUP_BANNER = "=" * 60
+_CYCLE_BANNER = "=" * 70
+
+# Telegram alert templates (sent with parse_mode=HTML: escape any free text)
+_DRIFT_ALERT_TEMPLATE = (
+    "⚠️ <b>[{mode}] DRIFT DETECTED</b>\n"
+    "━━━━━━━━━━━━━━━━━━\n"
+    "<b>Issue:</b> Scan loop stalled\n"
+    "<b>Last scan:</b> {elapsed:.0f}s ago\n"
+    "<b>Max allowed:</b> {max_stall:.0f}s\n"
+    "<b>Scan interval:</b> {scan_interval}s\n"
+    "\n⚠️ <i>Bot may be hung or stuck in scan loop</i>"
+)
+_CRITICAL_ERROR_TEMPLATE = (
+    "🚨 [{mode}] CRITICAL ERROR\n"
+    "Type: {error_type}\n"
+    "Message: {error_msg}\n"
+    "Bot will attempt to continue...\n"
+    "(Rate limited: max 1 alert per 15 min)"
+)
+_FATAL_ERROR_TEMPLATE = (
+    "🚨 [{mode}] FATAL ERROR\n"
+    "Type: {error_type}\n"
+    "Message: {error_msg}\n"
+    "BOT IS SHUTTING DOWN"
+)
+
+# Longest single sleep in the DFE timer before the wall clock is checked again
+DFE_RECHECK_SECONDS = 3600
+
+# How long loops get after shutdown to finish their current iteration before being cancelled
+SHUTDOWN_GRACE_SECONDS = 10
+
+
 class AlphaSniperBot:
     """
     Main trading bot class
@@ -44,11 +83,11 @@ class AlphaSniperBot:
 
         # Log startup
         mode_str = "SIM" if self.config.sim_mode else "LIVE"
-        self.logger.info("=" * 60)
+        self.logger.info(_STARTUP_BANNER)
         self.logger.info("🚀 Alpha Sniper V4.2 Starting...")
         self.logger.info(f"🔧 Mode: {mode_str}")
         self.logger.info(f"💰 Starting Equity: ${self.config.starting_equity:.2f}")
-        self.logger.info("=" * 60)
+        self.logger.info(_STARTUP_BANNER)
 
         # Log V4.2 Overlay Status
         self.logger.info("")
@@ -77,6 +116,17 @@ class AlphaSniperBot:
         self.scanner = Scanner(self.exchange, self.risk_engine, self.config, self.logger)
         self.entry_dete_engine = EntryDETEngine(self.config, self.logger, self.exchange, self.risk_engine)
         self.pump_trailer = PumpTrailer(self.config, self.logger)
+        # symbol -> (latest 15m candle, ATR(14)) for trailed pump positions
+        self._pump_atr_cache = {}
+
+        # Streamed prices for open positions (real MEXC market data only)
+        self.price_book = None
+        if self.config.price_stream_enabled and isinstance(self.exchange, MexcExchange):
+            self.price_book = PriceBook(self.config, self.logger)
+
+        # One cap on in-flight REST fan-out requests for the whole bot: scan cycle,
+        # fast stop ticks and pump trailer klines all draw from the same slots
+        self._rest_slots = asyncio.Semaphore(self.config.ticker_fetch_concurrency)
 
         # Rate limiting for error notifications (15 min cooldown)
         self.last_error_notification = 0
@@ -85,14 +135,29 @@ class AlphaSniperBot:
         # Track if we've sent first equity sync notification
         self.first_equity_sync_notified = False
 
-        # Last scan time tracking (for drift detection and heartbeat)
+        # Last scan time tracking: wall-clock epoch for the health endpoint,
+        # monotonic seconds for drift detection (immune to NTP steps)
         self.last_scan_time = None
+        self._last_scan_mono = None
         self.drift_alert_sent = False  # Track if we've already sent drift alert
 
+        # Async loop state: set in _run_async so shutdown() can wake sleeping loops
+        self._loop = None
+        self._stop_event = None
+        self._tasks = []  # Loop tasks created by _run_async (cancelled on shutdown)
+        # Set when a trading cycle may have opened or queued entries; wakes an idle position loop
+        self._position_work = None
+        self._scan_heartbeat = None  # Set by scan_loop after every completed cycle (drift watchdog)
+
+        # Set while a trading cycle runs; a second cycle never starts on top of it
+        self._cycle_in_progress = False
+        # Monotonic time the Fast Stop Manager last finished a pass (None until the position loop runs)
+        self._last_fast_stop_check = None
+
         # Fast mode tracking
         self.fast_mode_start_time = None
         if self.config.fast_mode_enabled:
-            self.fast_mode_start_time = time.time()
+            self.fast_mode_start_time = time.monotonic()
             self.logger.info(f"⚡ FAST MODE ENABLED: {self.config.fast_scan_interval_seconds}s intervals")
             self.logger.info(f"   Will auto-disable after {self.config.fast_mode_max_runtime_hours} hours")
 
@@ -118,9 +183,28 @@ class AlphaSniperBot:
         # Running flag
         self.running = True
 
-    def trading_cycle(self):
+        # Set by the first shutdown() call; later calls (signal + caller cleanup) are no-ops
+        self._shutdown_event = threading.Event()
+
+    async def trading_cycle(self):
         """
         Main trading cycle - runs every scan interval
+        Skipped (with a warning) if the previous cycle is still running, so slow
+        cycles can't stack up and multiply API load.
+        """
+        if self._cycle_in_progress:
+            self.logger.warning("⏱️ Previous trading cycle still running - skipping this one")
+            return
+
+        self._cycle_in_progress = True
+        try:
+            await self._run_trading_cycle()
+        finally:
+            self._cycle_in_progress = False
+
+    async def _run_trading_cycle(self):
+        """
+        One pass of the trading cycle (see trading_cycle)
         """
         try:
             # Sync equity from MEXC in LIVE mode
@@ -150,9 +234,9 @@ class AlphaSniperBot:
             open_pos = len(self.risk_engine.open_positions)
 
             self.logger.info("")
-            self.logger.info("=" * 70)
+            self.logger.info(_CYCLE_BANNER)
             self.logger.info(f"🔄 New cycle | t={cycle_time} | regime={regime} | sim={self.config.sim_mode} | equity=${self.risk_engine.current_equity:.2f} | open_positions={open_pos}")
-            self.logger.info("=" * 70)
+            self.logger.info(_CYCLE_BANNER)
 
             # 1. Check daily reset
             self.risk_engine.check_daily_reset()
@@ -164,25 +248,31 @@ class AlphaSniperBot:
 
             # Send regime change alert if regime changed
             if old_regime != new_regime and old_regime is not None:
-                btc_price = 0
-                try:
-                    ticker = self.exchange.get_ticker('BTC/USDT')
-                    if ticker:
-                        btc_price = ticker.get('last', ticker.get('close', 0))
-                except:
-                    pass
+                # update_regime just read BTC from its daily klines; no extra ticker fetch
+                btc_price = self.risk_engine.regime_btc_price
                 self.alert_mgr.send_regime_change(old_regime, new_regime, btc_price)
                 self.logger.info(f"[TELEGRAM] Sent regime change notification: {old_regime} → {new_regime}")
 
-            # 3. Manage existing positions
-            self._manage_positions()
-
-            # 4. Run scanner to get signals
-            signals = self.scanner.scan()
+            # 3 + 4. Manage existing positions while the scanner runs in a worker thread
+            # The scanner only reads the regime; every position change stays on the event
+            # loop, and new entries are processed below once both have finished.
+            results = await asyncio.gather(
+                self._manage_positions(),
+                asyncio.to_thread(self.scanner.scan),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            signals = results[1]
 
             # 5. Process new signals
             if signals:
-                self._process_signals(signals)
+                # Entries opened this cycle are announced in one Telegram digest
+                with self.alert_mgr.digest():
+                    self._process_signals(signals)
+                if self._position_work is not None:
+                    self._position_work.set()
             else:
                 self.logger.info("📊 No signals to process")
 
@@ -208,20 +298,130 @@ class AlphaSniperBot:
                     error_type = type(e).__name__
                     error_msg = str(e)[:200]  # Limit to 200 chars
                     self.logger.info(f"[TELEGRAM] Sending critical error notification")
+                    # Escaped like the fatal alert: a raw '<' would make Telegram reject the message
                     self.telegram.send(
-                        f"🚨 [{mode}] CRITICAL ERROR\n"
-                        f"Type: {error_type}\n"
-                        f"Message: {error_msg}\n"
-                        f"Bot will attempt to continue...\n"
-                        f"(Rate limited: max 1 alert per 15 min)"
+                        _CRITICAL_ERROR_TEMPLATE.format(
+                            mode=mode,
+                            error_type=error_type,
+                            error_msg=html.escape(error_msg, quote=False),
+                        )
                     )
                     self.last_error_notification = current_time
             except:
                 pass  # Don't crash on Telegram failure
 
-    def _manage_positions(self):
+    async def _fetch_tickers(self, symbols: list) -> dict:
+        """
+        Fetch tickers for several symbols in (roughly) one round-trip
+        - Symbols with a fresh streamed price (PRICE_STREAM_ENABLED) skip REST;
+          those tickers carry only 'symbol' and 'last'
+        - Batch endpoint available: a single get_last_prices call; those tickers
+          also carry only 'symbol' and 'last' (position checks need nothing else)
+        - Otherwise: per-symbol fetches run concurrently in worker threads
+          (the exchange client is synchronous), at most TICKER_FETCH_CONCURRENCY at a time
+        Returns: dict {symbol -> ticker or None}
+        """
+        tickers = {}
+        if self.price_book is not None:
+            for symbol, price in self.price_book.get_prices(symbols).items():
+                tickers[symbol] = {'symbol': symbol, 'last': price}
+            symbols = [symbol for symbol in symbols if symbol not in tickers]
+            if not symbols:
+                return tickers
+
+        tickers.update(await self._fetch_tickers_rest(symbols))
+        return tickers
+
+    async def _fetch_prices(self, symbols: list) -> dict:
+        """Last prices via _fetch_tickers: dict {symbol -> price} (symbols without a price omitted)"""
+        tickers = await self._fetch_tickers(symbols)
+        return {symbol: ticker['last'] for symbol, ticker in tickers.items() if ticker and ticker.get('last')}
+
+    async def _fetch_tickers_rest(self, symbols: list) -> dict:
+        """
+        REST half of _fetch_tickers: dict {symbol -> ticker or None}
+        Each request is abandoned after TICKER_FETCH_TIMEOUT_SECONDS (symbol -> None),
+        so one stalled symbol can't delay the rest of the tick.
+        """
+        if self.exchange.has_batch_tickers():
+            try:
+                prices = await self._run_rest(self.exchange.get_last_prices, symbols)
+            except Exception as e:
+                self.logger.debug(f"Batch price fetch failed: {e}")
+                prices = {}
+            return {
+                symbol: {'symbol': symbol, 'last': prices[symbol]} if symbol in prices else None
+                for symbol in symbols
+            }
+
+        # Bound in-flight requests (shared with every other fan-out) so a large book
+        # doesn't trip the exchange rate limit
+        results = await asyncio.gather(
+            *[self._run_rest(self.exchange.get_ticker, symbol) for symbol in symbols],
+            return_exceptions=True
+        )
+
+        tickers = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                self.logger.debug("Ticker fetch failed for %s: %s", symbol, result)
+                result = None
+            tickers[symbol] = result
+
+        return tickers
+
+    async def _run_rest(self, func, *args, **kwargs):
+        """
+        Run a blocking exchange call in a worker thread under the shared REST slots
+        The caller stops waiting after TICKER_FETCH_TIMEOUT_SECONDS (asyncio.TimeoutError),
+        but the slot is held until the thread's request actually finishes, so abandoned
+        requests can't pile up past TICKER_FETCH_CONCURRENCY when the exchange is slow.
+        """
+        slots = self._rest_slots
+        await slots.acquire()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args, **kwargs))
+        except BaseException:
+            slots.release()
+            raise
+
+        def finished(done):
+            slots.release()
+            if not done.cancelled():
+                done.exception()  # Mark retrieved: nobody may be awaiting an abandoned request
+
+        future.add_done_callback(finished)
+        # shield(): a timeout cancels only our wait, not the future tracking the thread
+        return await asyncio.wait_for(asyncio.shield(future), self.config.ticker_fetch_timeout_seconds)
+
+    async def _fetch_klines(self, symbols: list, timeframe: str, limit: int) -> dict:
+        """
+        Fetch klines for several symbols concurrently in worker threads
+        (at most TICKER_FETCH_CONCURRENCY requests in flight, each capped at
+        TICKER_FETCH_TIMEOUT_SECONDS)
+        Returns: dict {symbol -> klines or None}
+        """
+        results = await asyncio.gather(
+            *[self._run_rest(self.exchange.get_klines, symbol, timeframe, limit=limit) for symbol in symbols],
+            return_exceptions=True
+        )
+
+        klines_by_symbol = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                self.logger.debug("Kline fetch failed for %s: %s", symbol, result)
+                result = None
+            klines_by_symbol[symbol] = result
+
+        return klines_by_symbol
+
+    async def _manage_positions(self):
         """
         Manage open positions: check SL/TP, max hold time, partial TPs
+        While the Fast Stop Manager is checking SL/TP on schedule, only max hold
+        time is left to enforce here (prices are then fetched only for positions
+        that need one). Without it (--once, stalled position loop) the full
+        exit rules run.
         """
         if not self.risk_engine.open_positions:
             self.logger.info("📊 No open positions to manage")
@@ -229,240 +429,212 @@ class AlphaSniperBot:
 
         self.logger.info(f"📊 Managing {len(self.risk_engine.open_positions)} open position(s)...")
 
+        # Loop invariants hoisted out of the per-position body
+        now = time.time()
+        apply_exit_rules = self._apply_exit_rules
+        log_debug = self.logger.debug
+        log_warning = self.logger.warning
+        # Per-position status lines are DEBUG-only; skip building them when nobody will see them
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        fast_stops_current = self._fast_stops_current()
+
+        positions = self.risk_engine.open_positions
+        if fast_stops_current and not debug_enabled:
+            positions = [p for p in positions if self._max_hold_exceeded(p, now)]
+            if not positions:
+                return
+
+        # Fetch all last prices up front in one concurrent batch
+        symbols = list(dict.fromkeys(p['symbol'] for p in positions))
+        prices = await self._fetch_prices(symbols)
+        get_price = prices.get
+
+        # The position loop may have closed some of these while prices were fetched;
+        # only evaluate positions that are still open (matched by identity)
+        open_ids = {id(p) for p in self.risk_engine.open_positions}
+        positions = [p for p in positions if id(p) in open_ids]
+
         positions_to_close = []
 
-        for position in self.risk_engine.open_positions:
+        for position in positions:
             try:
                 symbol = position['symbol']
-                side = position['side']
-                entry_price = position['entry_price']
-                stop_loss = position['stop_loss']
-                tp_2r = position.get('tp_2r', 0)
-                tp_4r = position.get('tp_4r', 0)
-                timestamp_open = position['timestamp_open']
-                max_hold_hours = position.get('max_hold_hours', 48)
 
                 # Get current price
-                ticker = self.exchange.get_ticker(symbol)
-                if not ticker:
-                    self.logger.warning(f"⚠️ Could not fetch ticker for {symbol}")
-                    continue
-
-                current_price = ticker.get('last', ticker.get('close', 0))
-                if current_price == 0:
+                current_price = get_price(symbol)
+                if not current_price:
+                    log_warning(f"⚠️ Could not fetch price for {symbol}")
                     continue
 
-                # Calculate PnL%
-                if side == 'long':
-                    pnl_pct = ((current_price / entry_price) - 1) * 100
+                if fast_stops_current:
+                    exit_reason = self._max_hold_exceeded(position, now)
                 else:
-                    pnl_pct = ((entry_price / current_price) - 1) * 100
-
-                # Calculate unrealized R-multiple for exit logic improvements
-                risk_per_unit = abs(entry_price - stop_loss)
-                if side == 'long':
-                    unrealized_pnl_per_unit = current_price - entry_price
-                else:
-                    unrealized_pnl_per_unit = entry_price - current_price
-
-                unrealized_r = unrealized_pnl_per_unit / risk_per_unit if risk_per_unit > 0 else 0
-
-                # Exit improvement: Move stop to breakeven at +0.7R
-                if unrealized_r >= 0.7 and 'breakeven_moved_at_07r' not in position:
-                    position['breakeven_moved_at_07r'] = True
-                    position['stop_loss'] = entry_price
-                    try:
-                        self.logger.info(f"[EXIT] Breakeven activated for {symbol}: {float(unrealized_r):.2f}R")
-                    except:
-                        self.logger.info(f"[EXIT] Breakeven activated for {symbol}")
-
-                # Exit improvement: Partial TP (50%) at +2R
-                if unrealized_r >= 2.0 and 'partial_tp_taken' not in position:
-                    qty = position.get('qty', 0)
-                    partial_qty = qty * 0.5
-
-                    # Execute the partial close order (LIVE mode)
-                    if not self.config.sim_mode:
-                        try:
-                            close_side = 'sell' if side == 'long' else 'buy'
-                            order = self.exchange.create_order(
-                                symbol=symbol,
-                                type='market',
-                                side=close_side,
-                                amount=partial_qty
-                            )
-                            if not order or not order.get('id'):
-                                self.logger.error(f"[EXIT] Partial TP order failed for {symbol}")
-                                continue
-                        except Exception as e:
-                            self.logger.error(f"[EXIT] Failed to execute partial TP for {symbol}: {e}")
-                            continue
-
-                    # Mark as taken and update position tracking
-                    position['partial_tp_taken'] = True
-                    position['qty'] = qty - partial_qty
-                    if 'size_usd' in position:
-                        position['size_usd'] = position['size_usd'] * 0.5
-
-                    self.logger.info(f"[EXIT] Partial TP at +2R for {symbol}: closed 50% at {current_price:.6f}")
-
-                # Check max hold time
-                hold_time_hours = (time.time() - timestamp_open) / 3600
-                if hold_time_hours >= max_hold_hours:
-                    positions_to_close.append((position, current_price, f"Max hold time ({max_hold_hours}h)"))
+                    exit_reason = apply_exit_rules(position, current_price, fast=False, now=now)
+                if exit_reason:
+                    positions_to_close.append((position, current_price, exit_reason))
                     continue
 
-                # Check stop loss
-                if side == 'long':
-                    if current_price <= stop_loss:
-                        positions_to_close.append((position, current_price, "Stop loss hit"))
-                        continue
-                else:  # short
-                    if current_price >= stop_loss:
-                        positions_to_close.append((position, current_price, "Stop loss hit"))
-                        continue
-
-                # Check take profit targets
-                if side == 'long':
-                    if current_price >= tp_4r:
-                        positions_to_close.append((position, current_price, "4R target hit"))
-                        continue
-                    elif current_price >= tp_2r:
-                        # Partial TP: move SL to breakeven if not already done
-                        if 'breakeven_moved' not in position:
-                            position['breakeven_moved'] = True
-                            position['stop_loss'] = entry_price * 1.001  # Breakeven + 0.1%
-                            self.logger.info(f"✅ {symbol} {side} | 2R hit, SL moved to breakeven")
-                else:  # short
-                    if current_price <= tp_4r:
-                        positions_to_close.append((position, current_price, "4R target hit"))
-                        continue
-                    elif current_price <= tp_2r:
-                        if 'breakeven_moved' not in position:
-                            position['breakeven_moved'] = True
-                            position['stop_loss'] = entry_price * 0.999  # Breakeven - 0.1%
-                            self.logger.info(f"✅ {symbol} {side} | 2R hit, SL moved to breakeven")
-
                 # Log position status
-                self.logger.debug(
-                    f"   {symbol} {side} | "
-                    f"Entry: ${entry_price:.6f} | "
-                    f"Current: ${current_price:.6f} | "
-                    f"PnL: {pnl_pct:+.2f}% | "
-                    f"Hold: {hold_time_hours:.1f}h"
-                )
+                if debug_enabled:
+                    side = position['side']
+                    entry_price = position['entry_price']
+                    if side == 'long':
+                        pnl_pct = ((current_price / entry_price) - 1) * 100
+                    else:
+                        pnl_pct = ((entry_price / current_price) - 1) * 100
+                    hold_time_hours = (now - position['timestamp_open']) / 3600
+
+                    log_debug(
+                        "   %s %s | Entry: $%.6f | Current: $%.6f | PnL: %+.2f%% | Hold: %.1fh",
+                        symbol, side, entry_price, current_price, pnl_pct, hold_time_hours
+                    )
 
             except Exception as e:
                 self.logger.error(f"Error managing position {position.get('symbol', 'UNKNOWN')}: {e}")
                 continue
 
         # Close positions
-        for position, exit_price, reason in positions_to_close:
-            self.risk_engine.close_position(position, exit_price, reason)
+        self.risk_engine.close_positions(positions_to_close)
+
+    def _fast_stops_current(self) -> bool:
+        """True if the Fast Stop Manager finished a pass within the last two check intervals"""
+        if self._last_fast_stop_check is None:
+            return False
+        max_age = 2 * self.config.position_check_interval_seconds
+        return time.monotonic() - self._last_fast_stop_check <= max_age
+
+    @staticmethod
+    def _max_hold_exceeded(position: dict, now: float):
+        """Exit reason if position has been held for max_hold_hours or more, else None"""
+        max_hold_hours = position.get('max_hold_hours', 48)
+        if (now - position['timestamp_open']) / 3600 >= max_hold_hours:
+            return f"Max hold time ({max_hold_hours}h)"
+        return None
+
+    def _apply_exit_rules(self, position: dict, current_price: float, fast: bool, now: float = None):
+        """
+        Exit rules for one position at current_price, shared by the trading cycle
+        (_manage_positions) and the Fast Stop Manager (_check_fast_stops)
+        - Stop to breakeven at +0.7R, 50% partial take-profit at +2R
+        - Stop loss, 4R target, and stop to breakeven (+0.1%) once 2R is reached
+        - fast=False also enforces max hold time (needs now) before the stop check
+        Returns: exit reason if the position should be closed, else None
+        """
+        symbol = position['symbol']
+        side = position['side']
+        side_sign = 1 if side == 'long' else -1  # +1 long / -1 short: one set of side-agnostic checks
+        entry_price = position['entry_price']
+        stop_loss = position['stop_loss']
+        tp_2r = position.get('tp_2r', 0)
+        tp_4r = position.get('tp_4r', 0)
+
+        # Calculate unrealized R-multiple for exit logic improvements
+        # (from the live stop: breakeven moves and the pump trailer rewrite stop_loss,
+        # so a value cached at open would go stale)
+        risk_per_unit = abs(entry_price - stop_loss)
+        unrealized_pnl_per_unit = side_sign * (current_price - entry_price)
+
+        unrealized_r = unrealized_pnl_per_unit / risk_per_unit if risk_per_unit > 0 else 0
+
+        # Exit improvement: Move stop to breakeven at +0.7R
+        if unrealized_r >= 0.7 and 'breakeven_moved_at_07r' not in position:
+            position['breakeven_moved_at_07r'] = True
+            position['stop_loss'] = entry_price
+            self.risk_engine.mark_positions_dirty()
+            try:
+                self.logger.info(f"[EXIT] Breakeven activated for {symbol}: {float(unrealized_r):.2f}R")
+            except:
+                self.logger.info(f"[EXIT] Breakeven activated for {symbol}")
+
+        # Exit improvement: Partial TP (50%) at +2R
+        if unrealized_r >= 2.0 and 'partial_tp_taken' not in position:
+            qty = position.get('qty', 0)
+            partial_qty = qty * 0.5
+
+            # Execute the partial close order (LIVE mode); on failure skip this position until next check
+            if not self.config.sim_mode:
+                try:
+                    close_side = 'sell' if side == 'long' else 'buy'
+                    order = self.exchange.create_order(
+                        symbol=symbol,
+                        type='market',
+                        side=close_side,
+                        amount=partial_qty
+                    )
+                    if not order or not order.get('id'):
+                        self.logger.error(f"[EXIT] Partial TP order failed for {symbol}")
+                        return None
+                except Exception as e:
+                    self.logger.error(f"[EXIT] Failed to execute partial TP for {symbol}: {e}")
+                    return None
+
+            # Mark as taken and update position tracking
+            position['partial_tp_taken'] = True
+            position['qty'] = qty - partial_qty
+            if 'size_usd' in position:
+                position['size_usd'] = position['size_usd'] * 0.5
+            self.risk_engine.mark_positions_dirty()
+
+            self.logger.info(f"[EXIT] Partial TP at +2R for {symbol}: closed 50% at {current_price:.6f}")
+
+        marker = " (FAST STOP)" if fast else ""
+
+        # Check max hold time
+        if not fast:
+            max_hold_reason = self._max_hold_exceeded(position, now)
+            if max_hold_reason:
+                return max_hold_reason
+
+        # Check stop loss (long: price <= SL, short: price >= SL)
+        if side_sign * (current_price - stop_loss) <= 0:
+            return f"Stop loss hit{marker}"
+
+        # Check take profit targets (long: price >= TP, short: price <= TP)
+        if side_sign * (current_price - tp_4r) >= 0:
+            return f"4R target hit{marker}"
+        elif side_sign * (current_price - tp_2r) >= 0:
+            # Move SL to breakeven (+/-0.1% in the trade's favour) if not already done
+            if 'breakeven_moved' not in position:
+                position['breakeven_moved'] = True
+                position['stop_loss'] = entry_price * (1 + side_sign * 0.001)
+                self.risk_engine.mark_positions_dirty()
+                if fast:
+                    self.logger.info(f"[FastStop] {symbol} {side} | 2R hit, SL moved to breakeven")
+                else:
+                    self.logger.info(f"✅ {symbol} {side} | 2R hit, SL moved to breakeven")
 
-    def _check_fast_stops(self):
+        return None
+
+    async def _check_fast_stops(self):
         """
         Fast Stop Manager - lightweight check for SL/TP hits only
         Runs every POSITION_CHECK_INTERVAL_SECONDS (e.g. 15s)
         Does NOT scan for new signals or update regime
+        Returns: {symbol -> last price} snapshot used for this tick (shared with pump trailing)
         """
         if not self.risk_engine.open_positions:
-            return  # No positions to check
+            return {}  # No positions to check
 
         positions_to_close = []
 
+        # One batched price fetch for every open symbol
+        symbols = list(dict.fromkeys(p['symbol'] for p in self.risk_engine.open_positions))
+        prices = await self._fetch_prices(symbols)
+
+        # Loop invariants bound once
+        get_price = prices.get
+        apply_exit_rules = self._apply_exit_rules
+
         for position in self.risk_engine.open_positions:
             try:
-                symbol = position['symbol']
-                side = position['side']
-                entry_price = position['entry_price']
-                stop_loss = position['stop_loss']
-                tp_2r = position.get('tp_2r', 0)
-                tp_4r = position.get('tp_4r', 0)
-
-                # Get current price using ticker (real-time)
-                current_price = self.exchange.get_last_price(symbol)
-                if not current_price or current_price == 0:
+                # Current price from this tick's snapshot
+                current_price = get_price(position['symbol'])
+                if not current_price:
                     continue
 
-                # Calculate unrealized R-multiple for exit logic improvements
-                risk_per_unit = abs(entry_price - stop_loss)
-                if side == 'long':
-                    unrealized_pnl_per_unit = current_price - entry_price
-                else:
-                    unrealized_pnl_per_unit = entry_price - current_price
-
-                unrealized_r = unrealized_pnl_per_unit / risk_per_unit if risk_per_unit > 0 else 0
-
-                # Exit improvement: Move stop to breakeven at +0.7R
-                if unrealized_r >= 0.7 and 'breakeven_moved_at_07r' not in position:
-                    position['breakeven_moved_at_07r'] = True
-                    position['stop_loss'] = entry_price
-                    try:
-                        self.logger.info(f"[EXIT] Breakeven activated for {symbol}: {float(unrealized_r):.2f}R")
-                    except:
-                        self.logger.info(f"[EXIT] Breakeven activated for {symbol}")
-
-                # Exit improvement: Partial TP (50%) at +2R
-                if unrealized_r >= 2.0 and 'partial_tp_taken' not in position:
-                    qty = position.get('qty', 0)
-                    partial_qty = qty * 0.5
-
-                    # Execute the partial close order (LIVE mode)
-                    if not self.config.sim_mode:
-                        try:
-                            close_side = 'sell' if side == 'long' else 'buy'
-                            order = self.exchange.create_order(
-                                symbol=symbol,
-                                type='market',
-                                side=close_side,
-                                amount=partial_qty
-                            )
-                            if not order or not order.get('id'):
-                                self.logger.error(f"[EXIT] Partial TP order failed for {symbol}")
-                                continue
-                        except Exception as e:
-                            self.logger.error(f"[EXIT] Failed to execute partial TP for {symbol}: {e}")
-                            continue
-
-                    # Mark as taken and update position tracking
-                    position['partial_tp_taken'] = True
-                    position['qty'] = qty - partial_qty
-                    if 'size_usd' in position:
-                        position['size_usd'] = position['size_usd'] * 0.5
-
-                    self.logger.info(f"[EXIT] Partial TP at +2R for {symbol}: closed 50% at {current_price:.6f}")
-
-                # Check stop loss (FAST enforcement)
-                if side == 'long':
-                    if current_price <= stop_loss:
-                        positions_to_close.append((position, current_price, "Stop loss hit (FAST STOP)"))
-                        continue
-                else:  # short
-                    if current_price >= stop_loss:
-                        positions_to_close.append((position, current_price, "Stop loss hit (FAST STOP)"))
-                        continue
-
-                # Check take profit targets
-                if side == 'long':
-                    if current_price >= tp_4r:
-                        positions_to_close.append((position, current_price, "4R target hit (FAST STOP)"))
-                        continue
-                    elif current_price >= tp_2r:
-                        # Move to breakeven if not already done
-                        if 'breakeven_moved' not in position:
-                            position['breakeven_moved'] = True
-                            position['stop_loss'] = entry_price * 1.001
-                            self.logger.info(f"[FastStop] {symbol} {side} | 2R hit, SL moved to breakeven")
-                else:  # short
-                    if current_price <= tp_4r:
-                        positions_to_close.append((position, current_price, "4R target hit (FAST STOP)"))
-                        continue
-                    elif current_price <= tp_2r:
-                        if 'breakeven_moved' not in position:
-                            position['breakeven_moved'] = True
-                            position['stop_loss'] = entry_price * 0.999
-                            self.logger.info(f"[FastStop] {symbol} {side} | 2R hit, SL moved to breakeven")
+                exit_reason = apply_exit_rules(position, current_price, fast=True)
+                if exit_reason:
+                    positions_to_close.append((position, current_price, exit_reason))
 
             except Exception as e:
                 self.logger.error(f"[FastStop] Error checking {position.get('symbol', 'UNKNOWN')}: {e}")
@@ -483,7 +655,8 @@ class AlphaSniperBot:
 
             # Calculate R-multiple
             risk_per_unit = abs(entry - stop)
-            actual_pnl_per_unit = (exit_price - entry) if side == 'long' else (entry - exit_price)
+            side_sign = 1 if side == 'long' else -1
+            actual_pnl_per_unit = side_sign * (exit_price - entry)
             r_multiple = actual_pnl_per_unit / risk_per_unit if risk_per_unit > 0 else 0
 
             self.logger.info(
@@ -492,56 +665,115 @@ class AlphaSniperBot:
                 f"slip={slip_pct:+.2f}% | R={r_multiple:.2f}"
             )
 
-            self.risk_engine.close_position(position, exit_price, reason)
+        self.risk_engine.close_positions(positions_to_close)
+        return prices
 
-    def _update_pump_trailing_stops(self):
+    async def _update_pump_trailing_stops(self, prices: dict = None):
         """
         Update ATR-based trailing stops for pump positions
         Runs every POSITION_CHECK_INTERVAL_SECONDS (e.g. 15s) as part of position loop
+
+        Args:
+            prices: {symbol -> last price} already fetched this tick (from _check_fast_stops);
+                    symbols missing from it are fetched together in one batch
+        Klines are fetched concurrently in worker threads, so the event loop
+        never waits on a serial chain of REST calls.
         """
-        if not self.risk_engine.open_positions:
+        # Loop invariants bound once (one timestamp for the whole pass)
+        now = time.time()
+        pump_trailer = self.pump_trailer
+        log_debug = self.logger.debug
+
+        # Only pump positions past their trailing start are trailed
+        pump_positions = [p for p in self.risk_engine.get_positions_for_engine('pump') if pump_trailer.should_trail(p, now)]
+        if not pump_positions:
             return  # No positions to update
 
-        for position in self.risk_engine.open_positions:
-            try:
-                # Only process pump positions
-                if position.get('engine') != 'pump':
-                    continue
+        # Symbols this tick's snapshot has no price for: streamed if fresh, else one
+        # batched REST fetch (not a round-trip per position)
+        symbols = list(dict.fromkeys(p['symbol'] for p in pump_positions))
+        prices = dict(prices) if prices else {}
+        missing = [s for s in symbols if s not in prices]
+        if missing:
+            prices.update(await self._fetch_prices(missing))
 
-                # Check if this position should be trailed
-                if not self.pump_trailer.should_trail(position):
-                    continue
+        # 15m klines for ATR, all symbols at once
+        klines_by_symbol = await self._fetch_klines(symbols, '15m', limit=20)
 
+        # ATR only changes when the latest candle does (earlier candles are closed);
+        # entries for symbols no longer trailed are dropped
+        atr_cache = self._pump_atr_cache
+        self._pump_atr_cache = {}
+
+        for position in pump_positions:
+            try:
                 symbol = position['symbol']
 
-                # Get current price
-                current_price = self.exchange.get_last_price(symbol)
-                if not current_price or current_price == 0:
-                    self.logger.debug(f"[PumpTrailer] Skipping {symbol}: no price data")
+                current_price = prices.get(symbol)
+                if not current_price:
+                    log_debug("[PumpTrailer] Skipping %s: no price data", symbol)
                     continue
 
                 # Get 15m klines for ATR calculation
-                klines = self.exchange.get_klines(symbol, '15m', limit=20)
+                klines = klines_by_symbol.get(symbol)
                 if not klines or len(klines) < 15:
-                    self.logger.debug(f"[PumpTrailer] Skipping {symbol}: insufficient kline data")
-                    continue
-
-                # Convert to dataframe and calculate ATR
-                df_15m = helpers.ohlcv_to_dataframe(klines)
-                atr_series = helpers.calculate_atr(df_15m, 14)
-                if atr_series is None or len(atr_series) == 0:
-                    self.logger.debug(f"[PumpTrailer] Skipping {symbol}: ATR calculation failed")
+                    log_debug("[PumpTrailer] Skipping %s: insufficient kline data", symbol)
                     continue
 
-                atr_15m = atr_series.iloc[-1]
+                # ATR(14) of the latest candle (NumPy on the raw rows, no DataFrame per tick)
+                latest_candle = tuple(klines[-1])
+                cached = atr_cache.get(symbol)
+                if cached is not None and cached[0] == latest_candle:
+                    atr_15m = cached[1]
+                else:
+                    atr_15m = helpers.latest_atr(klines, 14)
+                    if not atr_15m >= 0:  # NaN: not enough candles
+                        log_debug("[PumpTrailer] Skipping %s: ATR calculation failed", symbol)
+                        continue
+                self._pump_atr_cache[symbol] = (latest_candle, atr_15m)
 
                 # Update trailing stop
-                self.pump_trailer.update(position, current_price, atr_15m)
+                if pump_trailer.update(position, current_price, atr_15m, now):
+                    self.risk_engine.mark_positions_dirty()
 
             except Exception as e:
-                self.logger.debug(f"[PumpTrailer] Error updating {position.get('symbol', 'UNKNOWN')}: {e}")
+                self.logger.debug("[PumpTrailer] Error updating %s: %s", position.get('symbol', 'UNKNOWN'), e)
                 continue
 
+    def _send_open_alert(self, position: dict, signal: dict, size: float):
+        """
+        Telegram trade-open alert for a just-opened position (SIM or LIVE)
+        size: quantity in base currency shown in the alert
+        """
+        mode = "SIM" if self.config.sim_mode else "LIVE"
+        try:
+            entry_price = position['entry_price']
+            stop_loss = position['stop_loss']
+            target = signal.get('tp_4r', signal.get('tp_2r', 0))
+            r_multiple = None
+            if stop_loss > 0 and entry_price > 0:
+                risk_per_unit = abs(entry_price - stop_loss)
+                if risk_per_unit > 0 and target > 0:
+                    reward_per_unit = abs(target - entry_price)
+                    r_multiple = reward_per_unit / risk_per_unit
+
+            self.alert_mgr.send_trade_open(
+                symbol=position['symbol'],
+                side=position['side'].upper(),
+                engine=position['engine'].upper(),
+                regime=position['regime'],
+                size=size,
+                entry=entry_price,
+                stop=stop_loss,
+                target=target if target > 0 else None,
+                leverage=1.0,
+                risk_pct=position['risk_pct'] * 100,
+                r_multiple=r_multiple
+            )
+            self.logger.debug("[TELEGRAM] Queued %s trade open notification for %s", mode, position['symbol'])
+        except Exception as e:
+            self.logger.warning(f"[TELEGRAM] Failed to send enhanced {mode} trade open notification: {e}")
+
     def _process_signals(self, signals: list):
         """
         Process new trading signals
@@ -551,17 +783,29 @@ class AlphaSniperBot:
         signals_opened = 0
         signals_queued = 0
 
+        # Settings read once per batch, not per signal
+        sim_mode = self.config.sim_mode
+        entry_dete_enabled = self.config.entry_dete_enabled
+        # Minimum position size (adjusted for account size): 1% of equity or $1, whichever is higher
+        min_position_size = max(1.0, self.config.starting_equity * 0.01)
+
         for signal in signals:
+            # Stop once the book is full - no remaining signal could open
+            has_room, reason = self.risk_engine.has_capacity()
+            if not has_room:
+                self.logger.info(f"⛔ Skipping remaining signals: {reason}")
+                break
+
             try:
                 # Check if we can open new position
                 can_open, reason = self.risk_engine.can_open_new_position(signal)
 
                 if not can_open:
-                    self.logger.debug(f"❌ Cannot open {signal['symbol']} {signal['engine']}: {reason}")
+                    self.logger.debug("❌ Cannot open %s %s: %s", signal['symbol'], signal['engine'], reason)
                     continue
 
                 # Entry-DETE: Queue signal instead of opening immediately
-                if self.config.entry_dete_enabled:
+                if entry_dete_enabled:
                     self.entry_dete_engine.queue_signal(signal)
                     signals_queued += 1
                     continue  # Skip immediate entry logic below
@@ -573,10 +817,8 @@ class AlphaSniperBot:
                 # Calculate position size
                 size_usd = self.risk_engine.calculate_position_size(signal, entry_price, stop_loss)
 
-                # Minimum position size (adjusted for account size)
-                min_position_size = max(1.0, self.config.starting_equity * 0.01)  # 1% of equity or $1, whichever is higher
                 if size_usd < min_position_size:
-                    self.logger.debug(f"❌ Position size too small for {signal['symbol']}: ${size_usd:.2f} (min: ${min_position_size:.2f})")
+                    self.logger.debug("❌ Position size too small for %s: $%.2f (min: $%.2f)", signal['symbol'], size_usd, min_position_size)
                     continue
 
                 # Calculate risk % and quantities
@@ -606,20 +848,15 @@ class AlphaSniperBot:
                 }
 
                 # Place order (SIM or LIVE)
-                if self.config.sim_mode:
+                if sim_mode:
                     # Detailed SIM logging
                     self.logger.info(
-                        f"✅ [SIM-OPEN] {position['symbol']} {position['side']} | "
-                        f"equity=${equity_at_entry:.2f} | "
-                        f"regime={position['regime']} | "
-                        f"risk={risk_pct*100:.3f}% | "
-                        f"risk_usd=${initial_risk_usd:.2f} | "
-                        f"size_usd=${size_usd:.2f} | "
-                        f"qty={qty:.6f} | "
-                        f"entry={entry_price:.6f} | "
-                        f"stop={stop_loss:.6f} | "
-                        f"engine={position['engine']} | "
-                        f"score={position['score']}"
+                        "✅ [SIM-OPEN] %s %s | equity=$%.2f | regime=%s | risk=%.3f%% | "
+                        "risk_usd=$%.2f | size_usd=$%.2f | qty=%.6f | entry=%.6f | "
+                        "stop=%.6f | engine=%s | score=%s",
+                        position['symbol'], position['side'], equity_at_entry, position['regime'],
+                        risk_pct * 100, initial_risk_usd, size_usd, qty, entry_price,
+                        stop_loss, position['engine'], position['score']
                     )
 
                     # Add position
@@ -627,31 +864,7 @@ class AlphaSniperBot:
                     signals_opened += 1
 
                     # Send enhanced Telegram notification for SIM open
-                    try:
-                        target = signal.get('tp_4r', signal.get('tp_2r', 0))
-                        r_multiple = None
-                        if stop_loss > 0 and entry_price > 0:
-                            risk_per_unit = abs(entry_price - stop_loss)
-                            if risk_per_unit > 0 and target > 0:
-                                reward_per_unit = abs(target - entry_price)
-                                r_multiple = reward_per_unit / risk_per_unit
-
-                        self.alert_mgr.send_trade_open(
-                            symbol=position['symbol'],
-                            side=position['side'].upper(),
-                            engine=position['engine'].upper(),
-                            regime=position['regime'],
-                            size=qty,
-                            entry=entry_price,
-                            stop=stop_loss,
-                            target=target if target > 0 else None,
-                            leverage=1.0,
-                            risk_pct=risk_pct * 100,
-                            r_multiple=r_multiple
-                        )
-                        self.logger.info(f"[TELEGRAM] Sent enhanced SIM trade open notification for {position['symbol']}")
-                    except Exception as e:
-                        self.logger.warning(f"[TELEGRAM] Failed to send enhanced trade open notification: {e}")
+                    self._send_open_alert(position, signal, qty)
 
                 else:
                     # LIVE order
@@ -668,10 +881,8 @@ class AlphaSniperBot:
 
                     if order and order.get('id'):
                         self.logger.info(
-                            f"✅ [LIVE] Opened {position['side']} | "
-                            f"{position['symbol']} | "
-                            f"Size: ${size_usd:.2f} | "
-                            f"Order ID: {order['id']}"
+                            "✅ [LIVE] Opened %s | %s | Size: $%.2f | Order ID: %s",
+                            position['side'], position['symbol'], size_usd, order['id']
                         )
 
                         position['order_id'] = order['id']
@@ -679,31 +890,7 @@ class AlphaSniperBot:
                         signals_opened += 1
 
                         # Send enhanced Telegram notification for LIVE open
-                        try:
-                            target = signal.get('tp_4r', signal.get('tp_2r', 0))
-                            r_multiple = None
-                            if stop_loss > 0 and entry_price > 0:
-                                risk_per_unit = abs(entry_price - stop_loss)
-                                if risk_per_unit > 0 and target > 0:
-                                    reward_per_unit = abs(target - entry_price)
-                                    r_multiple = reward_per_unit / risk_per_unit
-
-                            self.alert_mgr.send_trade_open(
-                                symbol=position['symbol'],
-                                side=position['side'].upper(),
-                                engine=position['engine'].upper(),
-                                regime=position['regime'],
-                                size=amount,
-                                entry=entry_price,
-                                stop=stop_loss,
-                                target=target if target > 0 else None,
-                                leverage=1.0,
-                                risk_pct=risk_pct * 100,
-                                r_multiple=r_multiple
-                            )
-                            self.logger.info(f"[TELEGRAM] Sent enhanced LIVE trade open notification for {position['symbol']}")
-                        except Exception as e:
-                            self.logger.warning(f"[TELEGRAM] Failed to send enhanced LIVE trade open notification: {e}")
+                        self._send_open_alert(position, signal, amount)
                     else:
                         self.logger.error(f"🔴 Failed to create order for {position['symbol']}")
 
@@ -733,6 +920,13 @@ class AlphaSniperBot:
         heat = self.risk_engine._calculate_current_heat()
         self.logger.info(f"   Portfolio Heat: {heat*100:.2f}% / {self.config.max_portfolio_heat*100:.2f}%")
 
+        cache_stats = self.exchange.cache_stats()
+        if cache_stats:
+            self.logger.debug("   Market data cache: " + " | ".join(
+                f"{kind} {s['hit_rate']*100:.0f}% hit ({s['hits']}/{s['hits'] + s['misses']}, size={s['size']})"
+                for kind, s in cache_stats.items()
+            ))
+
     def run_dfe(self):
         """
         Run Dynamic Filter Engine daily adjustment at 00:05 UTC
@@ -744,6 +938,59 @@ class AlphaSniperBot:
                 self.logger.error(f"DFE | Error running dynamic filter adjustment: {e}")
                 self.logger.exception(e)
 
+    async def price_stream_loop(self):
+        """
+        Stream prices for open positions into the price book until shutdown
+        A failure here only disables the stream; position checks fall back to REST.
+        """
+        self.logger.info(f"📡 Price stream enabled (stale after {self.config.price_stream_max_stale_seconds:g}s)")
+        try:
+            await self.price_book.run(lambda: self.risk_engine.positions_by_symbol.keys(), self._stop_event)
+        except Exception as e:
+            self.logger.error(f"📡 Price stream stopped, using REST prices: {e}")
+
+    async def _sleep(self, seconds: float) -> bool:
+        """
+        Sleep for up to `seconds`, waking early if shutdown was requested
+        Returns: True if woken by shutdown, False if the full delay elapsed
+        """
+        if self._stop_event is None:
+            await asyncio.sleep(max(0, seconds))
+            return False
+
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=max(0, seconds))
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _wait_for(self, event: asyncio.Event, timeout: float = None) -> bool:
+        """
+        Wait until event is set (or timeout seconds pass), waking early if shutdown was requested
+        Returns: True if woken by shutdown, False otherwise (check event.is_set() for timeout)
+        """
+        waiter = asyncio.ensure_future(event.wait())
+        stopper = asyncio.ensure_future(self._stop_event.wait())
+        await asyncio.wait({waiter, stopper}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        waiter.cancel()
+        stopper.cancel()
+        return self._stop_event.is_set()
+
+    def _has_position_work(self) -> bool:
+        """True if the position loop has anything to check (open positions or pending Entry-DETE signals)"""
+        if self.risk_engine.open_positions:
+            return True
+        return bool(self.config.entry_dete_enabled and self.entry_dete_engine.pending_signals)
+
+    @staticmethod
+    def _next_utc(hour: int, minute: int) -> datetime:
+        """Next HH:MM UTC (strictly after now)"""
+        now = datetime.now(timezone.utc)
+        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if target <= now:
+            target += timedelta(days=1)
+        return target
+
     async def scan_loop(self):
         """
         SCAN LOOP (slow, CPU-heavy)
@@ -751,8 +998,8 @@ class AlphaSniperBot:
         - Updates regime
         - Scans universe for signals
         - Opens new positions
-        - Runs DFE daily at 00:05 UTC
         - Supports FAST_MODE with auto-disable
+        - Sleeps until the next scan is due (no polling)
         """
         self.logger.info("🔄 SCAN LOOP started")
 
@@ -761,22 +1008,23 @@ class AlphaSniperBot:
         self.logger.info(f"   Scan interval: {scan_interval}s")
 
         # Run first cycle immediately
-        self.trading_cycle()
-        self.last_scan_time = time.time()  # Track scan time
+        # Interval math uses the monotonic clock so NTP steps can't stretch or skip scans;
+        # self.last_scan_time stays wall-clock for the health endpoint
+        last_scan_time = time.monotonic()
+        scan_started_at = time.time()
+        await self.trading_cycle()
+        self.last_scan_time = scan_started_at  # Track scan time
+        self._last_scan_mono = last_scan_time
+        self._beat_scan_heartbeat()
 
-        # Setup DFE scheduling if enabled
         if self.config.dfe_enabled:
-            schedule.every().day.at("00:05").do(self.run_dfe)
             self.logger.info("🔧 DFE enabled - scheduled daily at 00:05 UTC")
         else:
             self.logger.info("🔧 DFE disabled - filters will not auto-adjust")
 
-        last_scan_time = time.time()
-
         while self.running:
             try:
-                current_time = time.time()
-                elapsed = current_time - last_scan_time
+                current_time = time.monotonic()
 
                 # Check if FAST_MODE should be auto-disabled
                 if self.config.fast_mode_enabled and self.fast_mode_start_time:
@@ -808,23 +1056,53 @@ class AlphaSniperBot:
                         except Exception as e:
                             self.logger.warning(f"[TELEGRAM] Failed to send fast mode disable notification: {e}")
 
-                # Check if it's time to run next scan
-                if elapsed >= scan_interval:
-                    self.trading_cycle()
-                    last_scan_time = current_time
-                    self.last_scan_time = current_time  # Track for drift detection
-                    self.drift_alert_sent = False  # Reset drift alert when scan completes
-
-                # Check scheduled tasks (DFE)
-                schedule.run_pending()
+                # Sleep until the next scan is due (returns early on shutdown)
+                remaining = scan_interval - (current_time - last_scan_time)
+                if remaining > 0:
+                    await self._sleep(remaining)
+                    continue
 
-                # Short sleep to prevent CPU spinning
-                await asyncio.sleep(1)
+                # Advance along the deadline grid rather than resetting to "now", so wakeup
+                # jitter doesn't accumulate; a cycle that overran skips the missed ticks
+                # instead of triggering back-to-back catch-up scans
+                missed_ticks = 1
+                if scan_interval > 0:
+                    missed_ticks = max(1, int((current_time - last_scan_time) // scan_interval))
+                if missed_ticks > 1:
+                    self.logger.warning(f"⏱️ Scan loop behind schedule, skipping {missed_ticks - 1} missed tick(s)")
+                last_scan_time += missed_ticks * scan_interval
+
+                scan_started_at = time.time()
+                scan_started_mono = time.monotonic()
+                await self.trading_cycle()
+                self.last_scan_time = scan_started_at  # Track for the health endpoint
+                self._last_scan_mono = scan_started_mono  # Track for drift detection
+                self.drift_alert_sent = False  # Reset drift alert when scan completes
+                self._beat_scan_heartbeat()
 
             except Exception as e:
                 self.logger.error(f"Error in scan_loop: {e}")
                 self.logger.exception(e)
-                await asyncio.sleep(5)  # Back off on error
+                await self._sleep(5)  # Back off on error
+
+    async def dfe_loop(self):
+        """
+        DFE TIMER
+        - Sleeps until 00:05 UTC each day and runs the Dynamic Filter Engine
+        - The run itself (trade log and .env file I/O) happens in a worker thread
+        """
+        while self.running:
+            run_at = self._next_utc(hour=0, minute=5)
+            self.logger.debug(f"DFE | Next run at {run_at:%Y-%m-%d %H:%M} UTC")
+
+            # Sleep in chunks of at most DFE_RECHECK_SECONDS against the wall clock: a single
+            # ~24h monotonic sleep drifts with NTP steps and host suspend, and waking a hair
+            # early would otherwise run DFE twice around 00:05
+            while (remaining := (run_at - datetime.now(timezone.utc)).total_seconds()) > 0:
+                if await self._sleep(min(remaining, DFE_RECHECK_SECONDS)):
+                    return  # Shutdown requested
+
+            await asyncio.to_thread(self.run_dfe)
 
     async def position_loop(self):
         """
@@ -833,95 +1111,154 @@ class AlphaSniperBot:
         - Checks SL/TP for open positions only
         - Does NOT scan universe or generate signals
         - Does NOT update regime or filters
+        - Idles (no wakeups) while there are no positions or pending Entry-DETE signals
         """
         self.logger.info("⚡ POSITION LOOP (Fast Stop Manager) started")
 
-        # Wait a bit before starting to avoid conflicts with initial scan
-        await asyncio.sleep(self.config.position_check_interval_seconds)
+        # Checks run on a monotonic deadline grid: the interval is measured start to
+        # start (work time doesn't stretch it) and NTP steps can't shift it.
+        # Wait one interval first to avoid conflicts with the initial scan.
+        check_interval = self.config.position_check_interval_seconds
+        next_check = time.monotonic() + check_interval
+        if await self._sleep(check_interval):
+            return
 
         while self.running:
             try:
-                # Fast stop check
-                self._check_fast_stops()
+                # Idle (no positions, nothing pending): wait for the trading cycle to open or
+                # queue something instead of waking every interval for an empty pass
+                if self._position_work is not None:
+                    self._position_work.clear()
+                    if not self._has_position_work():
+                        if await self._wait_for(self._position_work):
+                            break
+                        next_check = time.monotonic()  # Restart the grid from the wakeup
+
+                # Fast stop check (its price snapshot is reused below, one fetch per tick)
+                prices = await self._check_fast_stops()
+                self._last_fast_stop_check = time.monotonic()
 
                 # Entry-DETE: Process pending signals for micro-confirmation
+                # (their prices are fetched together up front, not one by one in the loop)
                 if self.config.entry_dete_enabled:
-                    self.entry_dete_engine.process_pending()
+                    pending_symbols = list(dict.fromkeys(p['symbol'] for p in self.entry_dete_engine.pending_signals))
+                    missing = [symbol for symbol in pending_symbols if symbol not in prices]
+                    pending_prices = {symbol: prices[symbol] for symbol in pending_symbols if symbol in prices}
+                    if missing:
+                        pending_prices.update(await self._fetch_prices(missing))
+                    self.entry_dete_engine.process_pending(pending_prices)
 
                 # Pump Trailer: Update trailing stops for pump positions
-                self._update_pump_trailing_stops()
+                await self._update_pump_trailing_stops(prices)
 
                 # Save positions after any fast stop triggers or Entry-DETE openings
-                if self.risk_engine.open_positions:
-                    self.risk_engine.save_positions(self.config.positions_file_path)
-
-                # Sleep until next check
-                await asyncio.sleep(self.config.position_check_interval_seconds)
+                # (no-op unless something changed; must also run when the last position closed)
+                self.risk_engine.save_positions(self.config.positions_file_path)
+
+                # Sleep until the next check is due; a pass that overran skips the
+                # missed ticks instead of running back-to-back catch-up checks
+                next_check += check_interval
+                now = time.monotonic()
+                if now >= next_check and check_interval > 0:
+                    missed_ticks = int((now - next_check) // check_interval) + 1
+                    self.logger.debug("⏱️ Position loop behind schedule, skipping %d missed tick(s)", missed_ticks)
+                    next_check += missed_ticks * check_interval
+                if await self._sleep(next_check - now):
+                    break
 
             except Exception as e:
                 self.logger.error(f"Error in position_loop: {e}")
                 self.logger.exception(e)
-                await asyncio.sleep(5)  # Back off on error
+                if await self._sleep(5):  # Back off on error
+                    break
+                next_check = time.monotonic()
+
+    def _beat_scan_heartbeat(self):
+        """Wake the drift watchdog: a scan cycle just completed"""
+        if self._scan_heartbeat is not None:
+            self._scan_heartbeat.set()
 
     async def drift_detection_loop(self):
         """
-        DRIFT DETECTION LOOP
-        - Runs every 60s
-        - Checks if scan loop has stalled
+        DRIFT DETECTION LOOP (scan watchdog)
+        - Sleeps until either the scan loop reports a completed cycle or the stall deadline passes
+        - No periodic polling: a healthy scan loop only wakes it once per cycle
         - Sends Telegram alert if drift detected
         """
         self.logger.info("🔍 DRIFT DETECTION started")
 
         # Wait a bit before starting to avoid false positives on startup
-        await asyncio.sleep(120)  # 2 minutes grace period on startup
+        if await self._sleep(120):  # 2 minutes grace period on startup
+            return  # Shutdown requested
+
+        # Stall arithmetic runs on the monotonic clock: a wall-clock step (NTP, suspend)
+        # would otherwise fake a stall or hide a real one
+        mono = time.monotonic
+
+        # Max allowed stall time: max(3 * scan_interval, 600s) - config doesn't change while running
+        max_stall_seconds = max(
+            self.config.drift_max_stall_multiplier * self.config.scan_interval_seconds,
+            600  # 10 minutes minimum
+        )
 
         while self.running:
             try:
-                current_time = time.time()
+                # Clear before reading the scan time so a cycle finishing in between still wakes us
+                self._scan_heartbeat.clear()
+
+                if self._last_scan_mono is None or self.drift_alert_sent:
+                    # No scan yet, or this stall was already reported: nothing to time out on
+                    timeout = None
+                else:
+                    timeout = max_stall_seconds - (mono() - self._last_scan_mono)
 
-                # Check if last_scan_time exists and is set
-                if self.last_scan_time is not None:
-                    elapsed_since_scan = current_time - self.last_scan_time
+                if timeout is None or timeout > 0:
+                    if await self._wait_for(self._scan_heartbeat, timeout):
+                        break  # Shutdown requested
+                    if self._scan_heartbeat.is_set():
+                        continue  # Scan completed, re-arm the deadline
 
-                    # Calculate max allowed stall time: max(3 * scan_interval, 600s)
-                    max_stall_seconds = max(
-                        self.config.drift_max_stall_multiplier * self.config.scan_interval_seconds,
-                        600  # 10 minutes minimum
+                elapsed_since_scan = mono() - self._last_scan_mono
+
+                # Scan loop stalled - send alert only once per stall event
+                if elapsed_since_scan > max_stall_seconds and not self.drift_alert_sent:
+                    mode = "SIM" if self.config.sim_mode else "LIVE"
+                    self.logger.error(
+                        f"🚨 DRIFT DETECTED: Scan loop stalled! "
+                        f"Last scan: {elapsed_since_scan:.0f}s ago (max: {max_stall_seconds:.0f}s)"
                     )
 
-                    # Check if scan loop has stalled
-                    if elapsed_since_scan > max_stall_seconds:
-                        # Send alert only once per stall event
-                        if not self.drift_alert_sent:
-                            mode = "SIM" if self.config.sim_mode else "LIVE"
-                            self.logger.error(
-                                f"🚨 DRIFT DETECTED: Scan loop stalled! "
-                                f"Last scan: {elapsed_since_scan:.0f}s ago (max: {max_stall_seconds:.0f}s)"
-                            )
+                    # Queue the Telegram alert (delivered by the notifier's sender thread,
+                    # never on this loop); a full queue retries a minute later
+                    try:
+                        queued = self.telegram.send(
+                            _DRIFT_ALERT_TEMPLATE.format(
+                                mode=mode,
+                                elapsed=elapsed_since_scan,
+                                max_stall=max_stall_seconds,
+                                scan_interval=self.config.scan_interval_seconds,
+                            ),
+                            description="Drift alert"
+                        )
+                        if queued or not self.telegram.enabled:
+                            self.drift_alert_sent = True
+                            if queued:
+                                self.logger.info("[TELEGRAM] Drift detection alert queued")
+                        else:
+                            self.logger.warning("[TELEGRAM] Drift alert not queued, retrying in 60s")
+                    except Exception as e:
+                        self.logger.warning(f"[TELEGRAM] Failed to send drift alert: {e}")
 
-                            # Send Telegram alert
-                            try:
-                                self.telegram.send(
-                                    f"⚠️ <b>[{mode}] DRIFT DETECTED</b>\n"
-                                    f"━━━━━━━━━━━━━━━━━━\n"
-                                    f"<b>Issue:</b> Scan loop stalled\n"
-                                    f"<b>Last scan:</b> {elapsed_since_scan:.0f}s ago\n"
-                                    f"<b>Max allowed:</b> {max_stall_seconds:.0f}s\n"
-                                    f"<b>Scan interval:</b> {self.config.scan_interval_seconds}s\n"
-                                    f"\n⚠️ <i>Bot may be hung or stuck in scan loop</i>"
-                                )
-                                self.logger.info("[TELEGRAM] Drift detection alert sent")
-                                self.drift_alert_sent = True
-                            except Exception as e:
-                                self.logger.warning(f"[TELEGRAM] Failed to send drift alert: {e}")
-
-                # Sleep for 60 seconds before next check
-                await asyncio.sleep(60)
+                    if not self.drift_alert_sent:
+                        # Retry later unless a scan completes first
+                        if await self._wait_for(self._scan_heartbeat, 60):
+                            break
 
             except Exception as e:
                 self.logger.error(f"Error in drift_detection_loop: {e}")
                 self.logger.exception(e)
-                await asyncio.sleep(60)  # Continue checking even on error
+                if await self._sleep(60):  # Continue checking even on error
+                    break
 
     def run(self):
         """
@@ -931,6 +1268,9 @@ class AlphaSniperBot:
             # Run both loops concurrently using asyncio
             asyncio.run(self._run_async())
 
+            # Loops stopped (signal or shutdown request): save state and notify
+            self.shutdown()
+
         except KeyboardInterrupt:
             self.logger.info("")
             self.logger.info("👋 Bot stopped by user (Ctrl+C)")
@@ -941,37 +1281,64 @@ class AlphaSniperBot:
             self.logger.exception(e)
 
             # Send fatal error alert to Telegram
+            mode = "SIM" if self.config.sim_mode else "LIVE"
+            error_type = type(e).__name__
+            error_msg = str(e)[:200]  # Limit to 200 chars
+            # Exception text often contains '<' (e.g. "<Task ...>"), which Telegram's
+            # HTML parser would reject - and the alert would be lost
+            alert = _FATAL_ERROR_TEMPLATE.format(
+                mode=mode,
+                error_type=error_type,
+                error_msg=html.escape(error_msg, quote=False),
+            )
+            self.logger.info(f"[TELEGRAM] Sending fatal error notification")
             try:
-                mode = "SIM" if self.config.sim_mode else "LIVE"
-                error_type = type(e).__name__
-                error_msg = str(e)[:200]  # Limit to 200 chars
-                self.logger.info(f"[TELEGRAM] Sending fatal error notification")
-                self.telegram.send(
-                    f"🚨 [{mode}] FATAL ERROR\n"
-                    f"Type: {error_type}\n"
-                    f"Message: {error_msg}\n"
-                    f"BOT IS SHUTTING DOWN"
-                )
-            except:
-                pass  # Don't crash on Telegram failure
+                self.telegram.send(alert, description="Fatal error")
+            except Exception as send_error:  # Don't crash on Telegram failure
+                self.logger.warning(f"[TELEGRAM] Failed to send fatal error alert: {send_error}")
 
             self.shutdown()
 
     async def _run_async(self):
         """
-        Run scan_loop, position_loop, and drift_detection concurrently
+        Run scan_loop, position_loop, drift_detection and the DFE timer concurrently
         """
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._position_work = asyncio.Event()
+        self._scan_heartbeat = asyncio.Event()
+
+        if self.config.asyncio_debug_enabled:
+            self._enable_loop_debug()
+
+        # Handle SIGINT/SIGTERM on the event loop rather than in a C-level signal handler,
+        # so stopping is cooperative; run() saves state once the loops have exited
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self._loop.add_signal_handler(sig, self._on_signal, sig)
+            except (NotImplementedError, RuntimeError):
+                pass  # Not supported here (e.g. Windows): main()'s signal.signal handler stays
+
         try:
-            tasks = [
+            loops = [
                 self.scan_loop(),
                 self.position_loop()
             ]
 
             # Add drift detection if enabled
             if self.config.drift_detection_enabled:
-                tasks.append(self.drift_detection_loop())
+                loops.append(self.drift_detection_loop())
+
+            # Add daily DFE timer if enabled
+            if self.config.dfe_enabled:
+                loops.append(self.dfe_loop())
 
-            await asyncio.gather(*tasks)
+            # Add WebSocket price stream if enabled
+            if self.price_book is not None:
+                loops.append(self.price_stream_loop())
+
+            self._tasks = [asyncio.create_task(coro, name=coro.__name__) for coro in loops]
+            await asyncio.gather(*self._tasks)
 
         except asyncio.CancelledError:
             self.logger.info("Async loops cancelled")
@@ -979,18 +1346,104 @@ class AlphaSniperBot:
             self.logger.error(f"Error in async loops: {e}")
             self.logger.exception(e)
             raise
+        finally:
+            # Reap every loop so none is left pending when the event loop closes
+            self._cancel_tasks()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _enable_loop_debug(self):
+        """
+        Run the event loop in asyncio debug mode
+        asyncio then warns ("Executing <Task ...> took 0.350 seconds") whenever a step
+        blocks the loop past SLOW_CALLBACK_THRESHOLD_SECONDS; those warnings are routed
+        to the bot's log handlers. Debug mode adds overhead - leave it off normally.
+        """
+        self._loop.set_debug(True)
+        self._loop.slow_callback_duration = self.config.slow_callback_threshold_seconds
+
+        asyncio_logger = logging.getLogger("asyncio")
+        for handler in self.logger.handlers:
+            if handler not in asyncio_logger.handlers:
+                asyncio_logger.addHandler(handler)
+
+        self.logger.warning(
+            f"🐢 asyncio debug mode on: logging event-loop stalls > {self.config.slow_callback_threshold_seconds}s"
+        )
+
+    def _on_signal(self, sig):
+        """SIGINT/SIGTERM on the event loop: stop the loops; a second signal cancels them at once"""
+        if not self.running:
+            self._cancel_tasks()
+            return
+        self.logger.info("")
+        self.logger.info(f"👋 Received {signal.Signals(sig).name}, stopping loops")
+        self._request_stop()
+
+    def _request_stop(self):
+        """
+        Ask the async loops to stop (thread- and signal-safe)
+        Wakes loops sleeping until their next tick; any loop still busy after
+        SHUTDOWN_GRACE_SECONDS (e.g. mid-scan) is cancelled
+        """
+        self.running = False
+        if self._stop_event is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._stop_event.set)
+                self._loop.call_soon_threadsafe(self._loop.call_later, SHUTDOWN_GRACE_SECONDS, self._cancel_tasks)
+            except RuntimeError:
+                pass  # Event loop already closed
+
+    def _cancel_tasks(self):
+        """Cancel loop tasks that are still running (event loop thread only)"""
+        pending = [task for task in self._tasks if not task.done()]
+        if pending:
+            self.logger.debug("Cancelling %d async loop(s): %s", len(pending), ", ".join(t.get_name() for t in pending))
+        for task in pending:
+            task.cancel()
+
+    def reload_config(self):
+        """
+        Re-read configuration without restarting (SIGHUP)
+        Settings apply from their next use; loop intervals already in effect and
+        RESTART_ONLY_SETTINGS need a restart.
+        """
+        try:
+            skipped = self.config.reload()
+        except Exception as e:
+            self.logger.error(f"⚙️ Config reload failed, keeping current settings: {e}")
+            return
+
+        self.risk_engine.apply_config()
+        self.logger.info("⚙️ Configuration reloaded")
+        if skipped:
+            self.logger.warning(f"⚙️ Restart required to change: {', '.join(skipped)}")
+
+    def request_config_reload(self):
+        """
+        Signal-safe entry point for reload_config
+        Defers the reload to the event loop (between awaits) when it is running.
+        """
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self.reload_config)
+        else:
+            self.reload_config()
 
     def shutdown(self):
         """
         Graceful shutdown
+        Idempotent: only the first call saves state and notifies
 
         NOTE: Does NOT call sys.exit() - that must be handled by the caller
         to avoid SystemExit exceptions inside async event loops
         """
+        if self._shutdown_event.is_set():
+            return
+        self._shutdown_event.set()
+
         self.logger.info("🛑 Shutting down...")
 
         # Stop the bot loop
-        self.running = False
+        self._request_stop()
 
         # Save final positions
         try:
@@ -1005,6 +1458,12 @@ class AlphaSniperBot:
             except Exception as e:
                 self.logger.error(f"Error sending Telegram shutdown message: {e}")
 
+        # Flush queued Telegram messages before the process exits
+        try:
+            self.telegram.close()
+        except Exception as e:
+            self.logger.error(f"Error flushing Telegram queue: {e}")
+
         self.logger.info("👋 Goodbye!")
 
 
@@ -1020,7 +1479,8 @@ def main():
 
     bot = AlphaSniperBot()
 
-    # Handle graceful shutdown
+    # Handle graceful shutdown (fallback for --once; the main loops install
+    # event-loop signal handlers in _run_async)
     def signal_handler(sig, frame):
         bot.logger.info("")
         bot.logger.info("👋 Received shutdown signal")
@@ -1030,10 +1490,14 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
+    # Reload configuration on SIGHUP (not available on Windows)
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, lambda sig, frame: bot.request_config_reload())
+
     # Run mode
     if args.once:
         bot.logger.info("🧪 Running in --once test mode (single cycle)")
-        bot.trading_cycle()
+        asyncio.run(bot.trading_cycle())
         bot.logger.info("✅ Test cycle complete, exiting")
         bot.shutdown()
     else:
@@ -6,6 +6,7 @@ Risk Engine for Alpha Sniper V4.2
 - Daily loss limit
 """
 import time
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from typing import Optional, Dict, List
 from utils import helpers
@@ -93,7 +94,10 @@ class RiskEngine:
         # Regime state
         self.current_regime = None
         self.last_regime_update = 0
-        self.regime_update_interval = 3600  # 1 hour
+        self.regime_btc_price = 0  # BTC close the current regime was computed from
+
+        # Values derived from config (regime_update_interval, regime risk table)
+        self.apply_config()
 
         # Equity tracking
         # In SIM mode: use config.starting_equity as baseline
@@ -104,8 +108,16 @@ class RiskEngine:
         self.daily_pnl = 0.0
         self.daily_reset_time = self._get_next_utc_midnight()
 
-        # Open positions
+        # Open positions (list keeps open order and the on-disk format)
         self.open_positions = []
+        # Symbol index over open_positions: symbol -> [position, ...]
+        self.positions_by_symbol = {}
+        # Engine index over open_positions: engine -> [position, ...] (pump trailing walks only 'pump')
+        self.positions_by_engine = {}
+        # Running sum of open positions' risk_pct (portfolio heat)
+        self._open_heat = 0.0
+        # Set whenever open positions change; save_positions skips the write while clean
+        self._positions_dirty = True
 
         # Position tracking for daily loss and reporting
         self.closed_trades_today = []
@@ -257,7 +269,8 @@ class RiskEngine:
         """
         current_time = time.time()
 
-        # Only update if stale (> 1 hour old) or None
+        # Quiescent fast path: reuse the cached regime until REGIME_UPDATE_INTERVAL_SECONDS
+        # has passed, so idle cycles do no kline work here at all
         if self.current_regime is not None:
             if (current_time - self.last_regime_update) < self.regime_update_interval:
                 return self.current_regime
@@ -269,7 +282,7 @@ class RiskEngine:
             ohlcv = self.exchange.get_klines('BTC/USDT', '1d', limit=250)
             if not ohlcv or len(ohlcv) < 200:
                 self.logger.warning("⚠️ Not enough BTC data for regime detection, defaulting to SIDEWAYS")
-                self.current_regime = "SIDEWAYS"
+                self._set_regime("SIDEWAYS")
                 self.last_regime_update = current_time
                 return self.current_regime
 
@@ -289,6 +302,7 @@ class RiskEngine:
                 return_30d = 0.0
 
             current_price = df['close'].iloc[-1]
+            self.regime_btc_price = float(current_price)
 
             self.logger.info(f"📈 Regime update | price={current_price:.2f}, ema200={ema200:.2f}, RSI={rsi:.1f}, 30d={return_30d:.2f}%")
 
@@ -319,7 +333,10 @@ class RiskEngine:
                 )
                 self.logger.info(f"[TELEGRAM] Sending regime change notification")
                 self.telegram.send(alert_msg)
-                self.current_regime = regime
+                self._set_regime(regime)
+
+                # Start the new regime on fresh market data
+                self.exchange.clear_market_data_cache()
             else:
                 self.logger.info(f"📊 Current regime: {regime}")
 
@@ -329,28 +346,40 @@ class RiskEngine:
         except Exception as e:
             self.logger.error(f"🔴 Error updating regime: {e}")
             if self.current_regime is None:
-                self.current_regime = "SIDEWAYS"
+                self._set_regime("SIDEWAYS")
             return self.current_regime
 
-    def get_risk_per_trade(self, engine: str = "standard") -> float:
+    def apply_config(self):
         """
-        Get risk per trade based on current regime and engine
-        Returns: risk as decimal (e.g., 0.0025 for 0.25%)
+        (Re)build the values RiskEngine derives from config
+        Called at init and again after a live config reload.
         """
-        if engine == "pump":
-            return self.config.pump_risk_per_trade
+        self.regime_update_interval = self.config.regime_update_interval_seconds  # default 1 hour
 
-        # Standard engines use regime-based risk
-        regime = self.current_regime or "SIDEWAYS"
-
-        risk_map = {
+        # Regime -> risk per trade (built once per config instead of per call)
+        self._risk_by_regime = {
             "BULL": self.config.risk_per_trade_bull,
             "SIDEWAYS": self.config.risk_per_trade_sideways,
             "MILD_BEAR": self.config.risk_per_trade_mild_bear,
             "DEEP_BEAR": self.config.risk_per_trade_deep_bear,
         }
+        self._set_regime(self.current_regime)
+
+    def _set_regime(self, regime: Optional[str]):
+        """Switch regime and resolve its standard-engine risk once, not per signal"""
+        self.current_regime = regime
+        self._standard_risk = self._risk_by_regime.get(regime or "SIDEWAYS", self.config.risk_per_trade_sideways)
+
+    def get_risk_per_trade(self, engine: str = "standard") -> float:
+        """
+        Get risk per trade based on current regime and engine
+        Returns: risk as decimal (e.g., 0.0025 for 0.25%)
+        """
+        if engine == "pump":
+            return self.config.pump_risk_per_trade
 
-        return risk_map.get(regime, self.config.risk_per_trade_sideways)
+        # Standard engines use regime-based risk (resolved on regime change)
+        return self._standard_risk
 
     def calculate_position_size(
         self,
@@ -421,6 +450,10 @@ class RiskEngine:
         symbol = signal.get('symbol')
         side = signal.get('side')
 
+        # Never stack a second position on a symbol we already hold
+        if symbol in self.positions_by_symbol:
+            return False, f"Already in position ({symbol})"
+
         # Check hard daily loss limit (-2% of session equity)
         if self.session_start_equity and self.session_start_equity > 0:
             session_pnl_pct = self.daily_pnl / self.session_start_equity
@@ -481,15 +514,14 @@ class RiskEngine:
             symbol = signal.get('symbol')
             bucket = self.get_symbol_bucket(symbol)
 
-            # Count positions in this bucket
-            bucket_count = sum(
-                1 for p in self.open_positions
+            # Open positions in this bucket (one pass serves both the count and the log)
+            bucket_symbols = [
+                p.get('symbol') for p in self.open_positions
                 if self.get_symbol_bucket(p.get('symbol', '')) == bucket
-            )
+            ]
+            bucket_count = len(bucket_symbols)
 
             if bucket_count >= self.config.max_correlated_positions:
-                # Get existing symbols in this bucket
-                bucket_symbols = [p.get('symbol') for p in self.open_positions if self.get_symbol_bucket(p.get('symbol', '')) == bucket]
                 self.logger.info(
                     f"[CorrelationGuard] REJECT symbol={symbol} | "
                     f"bucket={bucket} already has {bucket_count} positions {bucket_symbols} | "
@@ -517,38 +549,137 @@ class RiskEngine:
 
         return True, None
 
+    def has_capacity(self) -> tuple[bool, Optional[str]]:
+        """
+        Signal-independent gates: can ANY new position open right now?
+        Lets callers stop walking a signal batch once the book is full.
+        Returns: (has_room, reason_if_not)
+        """
+        if len(self.open_positions) >= self.config.max_concurrent_positions:
+            return False, f"Max concurrent positions reached ({len(self.open_positions)})"
+
+        # Cheapest possible entry still has to fit under the heat cap
+        min_risk = min(self._standard_risk, self.config.pump_risk_per_trade)
+        if (self._open_heat + min_risk) > self.config.max_portfolio_heat:
+            return False, f"Portfolio heat limit ({self._open_heat*100:.3f}% + {min_risk*100:.3f}% > {self.config.max_portfolio_heat*100:.2f}%)"
+
+        return True, None
+
     def _calculate_current_heat(self) -> float:
         """
-        Calculate current portfolio heat (sum of open position risks)
+        Current portfolio heat (sum of open position risks)
+        Kept as a running total by add/remove, so this is O(1).
+        """
+        return self._open_heat
+
+    def mark_positions_dirty(self):
+        """Flag open positions as changed so the next save_positions writes them"""
+        self._positions_dirty = True
+
+    def has_open_position(self, symbol: str) -> bool:
+        """O(1) check whether any position is open on symbol"""
+        return symbol in self.positions_by_symbol
+
+    def get_positions_for_symbol(self, symbol: str) -> List[Dict]:
+        """Open positions on symbol (empty list if none)"""
+        return self.positions_by_symbol.get(symbol, [])
+
+    def get_positions_for_engine(self, engine: str) -> List[Dict]:
+        """Open positions opened by engine (empty list if none)"""
+        return self.positions_by_engine.get(engine, [])
+
+    def _rebuild_position_index(self):
+        """Rebuild the symbol/engine indexes and the heat total from open_positions (after load)"""
+        self.positions_by_symbol = {}
+        self.positions_by_engine = {}
+        for position in self.open_positions:
+            self.positions_by_symbol.setdefault(position.get('symbol'), []).append(position)
+            self.positions_by_engine.setdefault(position.get('engine'), []).append(position)
+        self._open_heat = sum(pos.get('risk_pct', 0.0) for pos in self.open_positions)
+
+    def _remove_open_position(self, position: Dict) -> bool:
         """
-        total_risk = 0.0
-        for pos in self.open_positions:
-            risk_pct = pos.get('risk_pct', 0.0)
-            total_risk += risk_pct
-        return total_risk
+        Remove position (matched by identity) from open_positions and the indexes
+        Returns: True if it was open
+        """
+        for i, open_position in enumerate(self.open_positions):
+            if open_position is position:
+                del self.open_positions[i]
+                break
+        else:
+            return False
+
+        # Reset to exactly zero when flat so float error can't accumulate
+        self._open_heat = self._open_heat - position.get('risk_pct', 0.0) if self.open_positions else 0.0
+
+        symbol = position.get('symbol')
+        same_symbol = [p for p in self.positions_by_symbol.get(symbol, []) if p is not position]
+        if same_symbol:
+            self.positions_by_symbol[symbol] = same_symbol
+        else:
+            self.positions_by_symbol.pop(symbol, None)
+
+        engine = position.get('engine')
+        same_engine = [p for p in self.positions_by_engine.get(engine, []) if p is not position]
+        if same_engine:
+            self.positions_by_engine[engine] = same_engine
+        else:
+            self.positions_by_engine.pop(engine, None)
+        return True
 
     def add_position(self, position: Dict):
         """
         Add a new open position
         """
         self.open_positions.append(position)
+        self.positions_by_symbol.setdefault(position['symbol'], []).append(position)
+        self.positions_by_engine.setdefault(position.get('engine'), []).append(position)
+        self._open_heat += position.get('risk_pct', 0.0)
+        self._positions_dirty = True
         self.logger.info(f"✅ Position opened | {position['symbol']} {position['side']} | size=${position.get('size_usd', 0):.2f}")
 
-    def close_position(self, position: Dict, exit_price: float, reason: str):
+    def close_positions(self, closes: List[tuple]):
+        """
+        Close several positions in one pass
+        trades_today.json is rewritten once for the batch instead of once per close,
+        and the close alerts go out as one Telegram digest.
+
+        Args:
+            closes: list of (position, exit_price, reason)
+        """
+        if not closes:
+            return
+
+        # One Telegram digest for the whole batch
+        with self.alert_mgr.digest() if self.alert_mgr else nullcontext():
+            for position, exit_price, reason in closes:
+                self.close_position(position, exit_price, reason, persist_daily_trades=False)
+
+        self._save_daily_trades()
+
+    def close_position(self, position: Dict, exit_price: float, reason: str, persist_daily_trades: bool = True):
         """
         Close a position and update PnL
         FIX: Use qty for accurate PnL, use initial_risk_usd for R-multiple
+        persist_daily_trades=False leaves the trades_today.json write to the caller (see close_positions)
+        A position that is no longer open (already closed by the other loop) is ignored.
         """
+        # Take it out of open_positions before booking anything, so a position closed
+        # concurrently (scan cycle and position loop both awaiting prices) is booked once
+        if not self._remove_open_position(position):
+            self.logger.debug("Skipping close of %s %s: already closed", position.get('symbol'), position.get('side'))
+            return
+        self._positions_dirty = True
+
         entry_price = position['entry_price']
         qty = position.get('qty', 0)
         side = position['side']
         initial_risk_usd = position.get('initial_risk_usd', 0)
+        closed_at = time.time()  # One timestamp for cooldown, hold time and the trade record
 
-        # Calculate PnL using qty (FIXED)
-        if side == 'long':
-            pnl_usd = (exit_price - entry_price) * qty
-        else:  # short
-            pnl_usd = (entry_price - exit_price) * qty
+        # Calculate PnL using qty (FIXED); +1 long / -1 short
+        side_sign = 1 if side == 'long' else -1
+        pnl_usd = side_sign * (exit_price - entry_price) * qty
 
         # Calculate PnL percentage (relative to size_usd at entry)
         size_usd = position.get('size_usd', 0)
@@ -560,10 +691,7 @@ class RiskEngine:
         else:
             # Fallback to old method if initial_risk_usd not set
             sl_price = position['stop_loss']
-            if side == 'long':
-                risk_pct_price = abs((entry_price - sl_price) / entry_price)
-            else:
-                risk_pct_price = abs((sl_price - entry_price) / entry_price)
+            risk_pct_price = abs((entry_price - sl_price) / entry_price)
             r_multiple = pnl_pct / (risk_pct_price * 100) if risk_pct_price > 0 else 0
 
         # Update equity and daily PnL
@@ -576,7 +704,7 @@ class RiskEngine:
             side = position.get('side')
             if symbol and side:
                 cooldown_key = (symbol, side)
-                cooldown_end = time.time() + self.cooldown_duration
+                cooldown_end = closed_at + self.cooldown_duration
                 self.cooldown_tracker[cooldown_key] = cooldown_end
                 try:
                     self.logger.info(f"[RISK] Cooldown activated for {symbol} {side}: 4h block after loss")
@@ -584,7 +712,7 @@ class RiskEngine:
                     pass
 
         # Hold time
-        hold_time_sec = time.time() - position['timestamp_open']
+        hold_time_sec = closed_at - position['timestamp_open']
         hold_time_hours = hold_time_sec / 3600
 
         # Detailed SIM logging
@@ -629,7 +757,7 @@ class RiskEngine:
                     hold_time=hold_time_str,
                     reason=reason
                 )
-                self.logger.info(f"[TELEGRAM] Sent enhanced trade close notification for {position['symbol']}")
+                self.logger.debug("[TELEGRAM] Queued trade close notification for %s", position['symbol'])
             else:
                 # Fallback to simple notification
                 mode = "SIM" if self.config.sim_mode else "LIVE"
@@ -660,12 +788,13 @@ class RiskEngine:
             'r_multiple': r_multiple,
             'hold_time_hours': hold_time_hours,
             'exit_reason': reason,
-            'timestamp_close': time.time()
+            'timestamp_close': closed_at
         }
         self.closed_trades_today.append(closed_trade)
 
         # Persist to /var/run/alpha-sniper/trades_today.json
-        self._save_daily_trades()
+        if persist_daily_trades:
+            self._save_daily_trades()
 
         # Log to CSV
         try:
@@ -673,10 +802,6 @@ class RiskEngine:
         except Exception as e:
             self.logger.error(f"Error logging trade to CSV: {e}")
 
-        # Remove from open positions
-        if position in self.open_positions:
-            self.open_positions.remove(position)
-
     def check_daily_reset(self):
         """
         Check if we need to reset daily counters (at UTC midnight)
@@ -737,13 +862,18 @@ class RiskEngine:
     def save_positions(self, filepath: str):
         """
         Save open positions to JSON
+        No-op when nothing changed since the last successful save (dirty flag)
         Handles PermissionError gracefully - logs warning but doesn't crash
 
         Args:
             filepath: Full path to positions file (from config.positions_file_path)
         """
+        if not self._positions_dirty:
+            return
+
         try:
             helpers.save_json_atomic(filepath, self.open_positions)
+            self._positions_dirty = False
         except PermissionError as e:
             self.logger.error(f"❌ Permission error writing positions file at {filepath}: {e}")
             self.logger.error("Bot will continue but positions may not persist across restarts")
@@ -770,6 +900,7 @@ class RiskEngine:
 
         # Try to load positions
         self.open_positions = helpers.load_json(filepath, default=[])
+        self._rebuild_position_index()
 
         # Detect permission issues: file exists but we got default (empty list)
         if not self.open_positions and os.path.exists(filepath):
@@ -798,16 +929,10 @@ class RiskEngine:
         Persist today's closed trades to /var/run/alpha-sniper/trades_today.json
         This file is used for daily reporting and gets cleared at UTC midnight.
         """
-        import os
-        import json
-
         try:
-            # Ensure directory exists
-            os.makedirs('/var/run/alpha-sniper', exist_ok=True)
-
             filepath = '/var/run/alpha-sniper/trades_today.json'
 
-            # Save trades with atomic write
+            # Save trades with atomic write (orjson-serialized, creates the directory if needed)
             helpers.save_json_atomic(filepath, self.closed_trades_today)
 
         except Exception as e:
@@ -13,6 +13,7 @@ Safety:
     - Validates API keys presence/absence based on mode
 """
 import sys
+import asyncio
 import os
 import argparse
 from pathlib import Path
@@ -183,10 +184,14 @@ Safety:
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
+        # Reload configuration on SIGHUP (not available on Windows)
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, lambda sig, frame: bot.request_config_reload())
+
         # Run mode
         if args.once:
             logger.info("🧪 Running in --once test mode (single cycle)")
-            bot.trading_cycle()
+            asyncio.run(bot.trading_cycle())
             logger.info("✅ Test cycle complete, exiting")
             bot.shutdown()
             exit_code = 0
@@ -35,7 +35,7 @@ class BearMicroLongEngine:
                 if signal:
                     signals.append(signal)
             except Exception as e:
-                self.logger.debug(f"Error evaluating {symbol} for bear micro-long: {e}")
+                self.logger.debug("Error evaluating %s for bear micro-long: %s", symbol, e)
 
         return signals
 
@@ -31,7 +31,7 @@ class LongEngine:
                 if signal:
                     signals.append(signal)
             except Exception as e:
-                self.logger.debug(f"Error evaluating {symbol} for long: {e}")
+                self.logger.debug("Error evaluating %s for long: %s", symbol, e)
 
         return signals
 
@@ -96,7 +96,7 @@ class PumpEngine:
                 if result is not None:
                     signals.append(result)
             except Exception as e:
-                self.logger.debug(f"Error evaluating {symbol} for pump: {e}")
+                self.logger.debug("Error evaluating %s for pump: %s", symbol, e)
 
         # Debug summary
         if self.debug_enabled and debug_counts is not None:
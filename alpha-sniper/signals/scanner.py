@@ -4,6 +4,8 @@ Scanner for Alpha Sniper V4.2
 - Orchestrates all signal engines
 - Returns prioritized signals
 """
+from operator import itemgetter
+
 from utils import helpers
 from signals.long_engine import LongEngine
 from signals.short_engine import ShortEngine
@@ -11,6 +13,10 @@ from signals.pump_engine import PumpEngine
 from signals.bear_micro_long import BearMicroLongEngine
 
 
+# Banner framing each scanner cycle in the logs
+_SCAN_BANNER = "=" * 50
+
+
 class Scanner:
     """
     Master Scanner
@@ -31,6 +37,11 @@ class Scanner:
         self.pump_engine = PumpEngine(config, logger)
         self.bear_micro_engine = BearMicroLongEngine(config, logger)
 
+        # Filtered universe, reused until the markets object or the filter settings change
+        self._universe_markets = None
+        self._universe_key = None
+        self._universe = []
+
     def scan(self) -> list:
         """
         Main scan method
@@ -39,9 +50,9 @@ class Scanner:
         regime = self.risk_engine.current_regime or "SIDEWAYS"
 
         self.logger.info("")
-        self.logger.info("=" * 50)
+        self.logger.info(_SCAN_BANNER)
         self.logger.info(f"🔍 SCANNER CYCLE START | Regime: {regime}")
-        self.logger.info("=" * 50)
+        self.logger.info(_SCAN_BANNER)
 
         # 1. Get universe of tradeable symbols
         universe = self._build_universe()
@@ -110,7 +121,9 @@ class Scanner:
             # 4. Combine and sort signals by score
             all_signals = long_signals + short_signals + pump_signals + bear_micro_signals
 
-        all_signals.sort(key=lambda x: x.get('score', 0), reverse=True)
+        # Every engine attaches 'score'; the full order matters because
+        # _process_signals walks down the list past rejected signals
+        all_signals.sort(key=itemgetter('score'), reverse=True)
 
         # 5. Log results
         self.logger.info("")
@@ -145,7 +158,7 @@ class Scanner:
         else:
             self.logger.info("   No signals met criteria")
 
-        self.logger.info("=" * 50)
+        self.logger.info(_SCAN_BANNER)
         self.logger.info("")
 
         return all_signals
@@ -162,6 +175,12 @@ class Scanner:
                 self.logger.error("🔴 Failed to load markets from exchange")
                 return []
 
+            # Markets only change on a (TTL) reload, which swaps in a new dict;
+            # until then the filter result is the same every scan
+            universe_key = (self.config.mexc_spot_enabled, self.config.mexc_futures_enabled, self.config.sim_mode)
+            if markets is self._universe_markets and universe_key == self._universe_key:
+                return list(self._universe)
+
             universe = []
             rejected_counts = {
                 'quote_currency': 0,
@@ -217,7 +236,10 @@ class Scanner:
                 # For now, just take first 50
                 universe = universe[:50]
 
-            return universe
+            self._universe_markets = markets
+            self._universe_key = universe_key
+            self._universe = universe
+            return list(universe)
 
         except Exception as e:
             self.logger.error(f"🔴 Error building universe: {e}")
@@ -233,6 +255,10 @@ class Scanner:
         rejected_volume = 0
         rejected_spread = 0
 
+        # Filter thresholds read once per scan, not per symbol
+        min_volume = self.config.min_24h_quote_volume
+        max_spread_pct = self.config.max_spread_pct
+
         for symbol in universe:
             try:
                 # Fetch ticker
@@ -243,7 +269,7 @@ class Scanner:
 
                 # Volume filter
                 volume_24h = ticker.get('quoteVolume', 0)
-                if volume_24h < self.config.min_24h_quote_volume:
+                if volume_24h < min_volume:
                     rejected_volume += 1
                     continue
 
@@ -252,7 +278,7 @@ class Scanner:
                 ask = ticker.get('ask', 0)
                 spread_pct = helpers.calculate_spread_pct(bid, ask)
 
-                if spread_pct > self.config.max_spread_pct:
+                if spread_pct > max_spread_pct:
                     rejected_spread += 1
                     continue
 
@@ -287,7 +313,7 @@ class Scanner:
                 }
 
             except Exception as e:
-                self.logger.debug(f"Error fetching data for {symbol}: {e}")
+                self.logger.debug("Error fetching data for %s: %s", symbol, e)
                 fetch_errors += 1
                 continue
 
@@ -35,7 +35,7 @@ class ShortEngine:
                 if signal:
                     signals.append(signal)
             except Exception as e:
-                self.logger.debug(f"Error evaluating {symbol} for short: {e}")
+                self.logger.debug("Error evaluating %s for short: %s", symbol, e)
 
         return signals
 
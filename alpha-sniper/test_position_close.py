@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test that a position is booked exactly once when both loops close it
+
+The scan cycle's _manage_positions awaits prices; the position loop can close
+one of its positions meanwhile. The trade must not be booked twice.
+
+Usage:
+    python test_position_close.py
+"""
+
+import os
+import sys
+import time
+import asyncio
+import logging
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import get_config
+from risk_engine import RiskEngine
+from utils import helpers
+from main import AlphaSniperBot
+
+
+def test_close_during_price_fetch():
+    """Position closed by the position loop while _manage_positions fetches prices"""
+    logger = logging.getLogger("test_position_close")
+    config = get_config()
+
+    risk_engine = RiskEngine(config, exchange=None, logger=logger, telegram=None)
+    # Keep the test off the real trades_today.json / CSV files
+    risk_engine._save_daily_trades = lambda: None
+    original_log_trade = helpers.log_trade_to_csv
+    helpers.log_trade_to_csv = lambda trade: None
+
+    try:
+        position = {
+            'symbol': 'TEST/USDT',
+            'side': 'long',
+            'engine': 'standard',
+            'entry_price': 100.0,
+            'stop_loss': 95.0,
+            'qty': 1.0,
+            'size_usd': 100.0,
+            'initial_risk_usd': 5.0,
+            'risk_pct': 0.005,
+            'max_hold_hours': 1,
+            'timestamp_open': time.time() - 2 * 3600,  # Past max hold
+        }
+        risk_engine.add_position(position)
+        equity_before = risk_engine.current_equity
+
+        bot = AlphaSniperBot.__new__(AlphaSniperBot)
+        bot.config = config
+        bot.logger = logger
+        bot.risk_engine = risk_engine
+        bot._last_fast_stop_check = time.monotonic()  # Fast Stop Manager is current
+
+        async def fetch_prices_racing(symbols):
+            # The position loop closes the position while the scan cycle awaits prices
+            risk_engine.close_position(position, 110.0, "Fast stop")
+            await asyncio.sleep(0)
+            return {symbol: 110.0 for symbol in symbols}
+
+        bot._fetch_prices = fetch_prices_racing
+        asyncio.run(bot._manage_positions())
+
+        assert len(risk_engine.closed_trades_today) == 1
+        assert risk_engine.current_equity == equity_before + 10.0
+        assert risk_engine.open_positions == []
+
+        # Closing it again directly books nothing either
+        risk_engine.close_position(position, 120.0, "Duplicate")
+        assert len(risk_engine.closed_trades_today) == 1
+        assert risk_engine.current_equity == equity_before + 10.0
+    finally:
+        helpers.log_trade_to_csv = original_log_trade
+
+    print("✅ Position booked once")
+
+
+if __name__ == "__main__":
+    test_close_during_price_fetch()
@@ -93,11 +93,15 @@ class EntryDETEngine:
             f"score={signal.get('score')} | baseline={pending['baseline_price']:.6f}"
         )
 
-    def process_pending(self):
+    def process_pending(self, prices: dict = None):
         """
         Process all pending signals using micro-triggers.
         Called from POSITION LOOP every 15s.
 
+        Args:
+            prices: {symbol -> last price} fetched up front for the pending symbols
+                    (concurrently by the caller); missing symbols are fetched here
+
         For each pending signal:
         1. Check if expired (timeout)
         2. Evaluate micro-triggers
@@ -110,7 +114,12 @@ class EntryDETEngine:
         if not self.pending_signals:
             return  # Nothing to process
 
+        prices = prices or {}
         now = time.time()
+        # Loop invariants bound once
+        min_triggers = self.config.entry_dete_min_triggers
+        get_last_price = self.exchange.get_last_price
+        evaluate_micro_triggers = self._evaluate_micro_triggers
         confirmed = []
         expired = []
         still_waiting = []
@@ -132,15 +141,15 @@ class EntryDETEngine:
 
             # Evaluate micro-triggers
             try:
-                triggers = self._evaluate_micro_triggers(pending, now)
+                # One price per signal per tick: used for the triggers and the entry
+                current_price = prices.get(symbol) or get_last_price(symbol)
+                triggers = evaluate_micro_triggers(pending, now, current_price)
                 trigger_count = sum(triggers.values())
 
-                if trigger_count >= self.config.entry_dete_min_triggers:
+                if trigger_count >= min_triggers:
                     # Confirmed! Open position now
                     confirmed.append(pending)
 
-                    # Get current price for entry
-                    current_price = self.exchange.get_last_price(symbol)
                     if not current_price:
                         self.logger.warning(f"[Entry-DETE] No price for {symbol}, keeping in queue")
                         still_waiting.append(pending)
@@ -179,9 +188,10 @@ class EntryDETEngine:
         # Update pending list (remove confirmed and expired)
         self.pending_signals = still_waiting
 
-    def _evaluate_micro_triggers(self, pending, now):
+    def _evaluate_micro_triggers(self, pending, now, current_price=None):
         """
         Evaluate micro-triggers for a pending signal.
+        current_price: latest price if already fetched (looked up when None)
 
         Returns:
             dict of boolean triggers: {
@@ -203,26 +213,34 @@ class EntryDETEngine:
         }
 
         # Get current price
-        current_price = self.exchange.get_last_price(symbol)
+        if current_price is None:
+            current_price = self.exchange.get_last_price(symbol)
         if not current_price or current_price == 0:
             return triggers
 
         # 1. DIP CONFIRMATION
+        min_dip_pct = self.config.entry_dete_min_dip_pct
+        max_dip_pct = self.config.entry_dete_max_dip_pct
         if side == 'long':
             # For longs, want a small pullback (dip) from baseline
             dip_pct = (baseline_price - current_price) / baseline_price
-            if self.config.entry_dete_min_dip_pct <= dip_pct <= self.config.entry_dete_max_dip_pct:
+            if min_dip_pct <= dip_pct <= max_dip_pct:
                 triggers['dip_ok'] = True
         else:
             # For shorts, want a small bounce above baseline
             dip_pct = (current_price - baseline_price) / baseline_price
-            if self.config.entry_dete_min_dip_pct <= dip_pct <= self.config.entry_dete_max_dip_pct:
+            if min_dip_pct <= dip_pct <= max_dip_pct:
                 triggers['dip_ok'] = True
 
-        # 2. VOLUME RE-ENGAGEMENT
+        # Recent 1m candles, fetched once for the volume (last 5) and momentum (last 3) checks
+        klines = None
         try:
-            # Get recent 1m candles (last 5-10 for volume check)
             klines = self.exchange.get_klines(symbol, '1m', limit=10)
+        except Exception as e:
+            self.logger.debug("[Entry-DETE] 1m kline fetch failed for %s: %s", symbol, e)
+
+        # 2. VOLUME RE-ENGAGEMENT
+        try:
             if klines and len(klines) >= 5:
                 # Extract volumes
                 volumes = [candle[5] for candle in klines[-5:]]  # Last 5 candles
@@ -233,7 +251,7 @@ class EntryDETEngine:
                 if current_volume >= avg_volume * self.config.entry_dete_volume_multiplier:
                     triggers['volume_ok'] = True
         except Exception as e:
-            self.logger.debug(f"[Entry-DETE] Volume check failed for {symbol}: {e}")
+            self.logger.debug("[Entry-DETE] Volume check failed for %s: %s", symbol, e)
             # Don't fail the whole evaluation, just skip this trigger
 
         # 3. LIQUIDITY & SPREAD SANITY
@@ -253,12 +271,11 @@ class EntryDETEngine:
                 if spread_ok and depth_ok:
                     triggers['liquidity_ok'] = True
         except Exception as e:
-            self.logger.debug(f"[Entry-DETE] Liquidity check failed for {symbol}: {e}")
+            self.logger.debug("[Entry-DETE] Liquidity check failed for %s: %s", symbol, e)
 
         # 4. MOMENTUM NOT DEAD
         try:
             # Simple check: current price should be near recent candle range
-            klines = self.exchange.get_klines(symbol, '1m', limit=5)
             if klines and len(klines) >= 3:
                 recent_closes = [candle[4] for candle in klines[-3:]]
                 min_close = min(recent_closes)
@@ -273,7 +290,7 @@ class EntryDETEngine:
                     if current_price <= max_close * 1.002:
                         triggers['momentum_ok'] = True
         except Exception as e:
-            self.logger.debug(f"[Entry-DETE] Momentum check failed for {symbol}: {e}")
+            self.logger.debug("[Entry-DETE] Momentum check failed for %s: %s", symbol, e)
 
         return triggers
 
@@ -372,9 +389,9 @@ class EntryDETEngine:
                     position['order_id'] = order.get('id')
                     self.risk_engine.add_position(position)
 
-                    self.logger.info(
-                        f"[Entry-DETE] ✅ Position opened | symbol={signal['symbol']} | "
-                        f"side={signal['side']} | entry={entry_price:.6f}"
+                    self.logger.debug(
+                        "[Entry-DETE] ✅ Position opened | symbol=%s | side=%s | entry=%.6f",
+                        signal['symbol'], signal['side'], entry_price
                     )
                     return True
                 else:
@@ -8,6 +8,18 @@ from typing import Any, Dict
 import pandas as pd
 import numpy as np
 
+try:
+    import orjson  # C-backed JSON: much faster dumps/loads for state files
+except ImportError:
+    orjson = None
+
+# orjson options matching the stdlib output we used to write (indent=2),
+# plus native handling of numpy scalars that leak in from pandas math
+_ORJSON_DUMP_OPTIONS = (
+    (orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS)
+    if orjson is not None else 0
+)
+
 
 def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     """
@@ -21,12 +33,34 @@ def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     tr2 = abs(high - close.shift())
     tr3 = abs(low - close.shift())
 
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    # Row-wise max without building a 3-column frame (fmax skips the NaN in row 0, like max(axis=1))
+    tr = pd.Series(np.fmax(tr1.to_numpy(), np.fmax(tr2.to_numpy(), tr3.to_numpy())), index=df.index)
     atr = tr.rolling(window=period).mean()
 
     return atr
 
 
+def latest_atr(ohlcv: list, period: int = 14) -> float:
+    """
+    ATR of the most recent candle, straight from CCXT OHLCV rows
+    Same value as calculate_atr(ohlcv_to_dataframe(ohlcv), period).iloc[-1]
+    without building a DataFrame (used every position-loop tick).
+    Returns NaN if there are fewer than `period` candles.
+    """
+    if len(ohlcv) < period:
+        return float('nan')
+
+    # Only the last period candles (plus the one before, for prev close) matter
+    rows = np.asarray([row[2:5] for row in ohlcv[-(period + 1):]], dtype=np.float64)
+    high, low, close = rows[:, 0], rows[:, 1], rows[:, 2]
+
+    tr = high - low
+    prev_close = close[:-1]
+    tr[1:] = np.maximum(tr[1:], np.maximum(np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)))
+
+    return float(tr[-period:].mean())
+
+
 def calculate_ema(df: pd.DataFrame, column: str, period: int) -> pd.Series:
     """
     Calculate Exponential Moving Average
@@ -73,6 +107,28 @@ def calculate_momentum(df: pd.DataFrame, periods: int) -> float:
     return ((df['close'].iloc[-1] / df['close'].iloc[-periods-1]) - 1) * 100
 
 
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialize data to JSON bytes (orjson when available, stdlib json otherwise)
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=_ORJSON_DUMP_OPTIONS)
+        except TypeError:
+            pass  # Type orjson can't handle - let stdlib json try (or raise)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def loads_json(raw) -> Any:
+    """
+    Parse JSON from bytes/str (orjson when available, stdlib json otherwise)
+    Raises json.JSONDecodeError on malformed input (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def save_json_atomic(filepath: str, data: Any):
     """
     Atomically save JSON data (write to temp, then rename)
@@ -87,8 +143,9 @@ def save_json_atomic(filepath: str, data: Any):
     # Write to temp file in same directory, then atomic rename
     temp_path = filepath + '.tmp'
     try:
-        with open(temp_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        payload = dumps_json(data)
+        with open(temp_path, 'wb') as f:
+            f.write(payload)
         os.replace(temp_path, filepath)
     except PermissionError as e:
         # Clean up temp file if it exists
@@ -107,8 +164,8 @@ def load_json(filepath: str, default: Any = None) -> Any:
     Handles FileNotFoundError, JSONDecodeError, and PermissionError gracefully
     """
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return loads_json(f.read())
     except FileNotFoundError:
         return default if default is not None else []
     except json.JSONDecodeError:
@@ -0,0 +1,130 @@
+"""
+Price Book - streamed last prices for open positions
+
+WHY THIS EXISTS:
+The Fast Stop Manager checks every open position every few seconds. Polling
+REST for those prices costs a network round-trip per check and only sees the
+price at poll time. The price book keeps a MEXC WebSocket ticker subscription
+(via ccxt.pro) for the symbols we hold and stores the latest price in memory:
+- Position checks read prices locally (no REST call while the stream is fresh)
+- Prices older than PRICE_STREAM_MAX_STALE_SECONDS are ignored, so callers
+  fall back to REST whenever the stream lags or drops
+- Reconnects with exponential backoff; the bot keeps trading on REST meanwhile
+"""
+
+import asyncio
+import time
+
+
+# Reconnect backoff bounds (seconds)
+RECONNECT_MIN_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+
+
+class PriceBook:
+    """
+    Latest streamed price per symbol
+
+    Usage:
+        book = PriceBook(config, logger)
+        await book.run(lambda: symbols, stop_event)   # as an asyncio task
+        book.get_price('BTC/USDT')                    # None if missing or stale
+    """
+
+    def __init__(self, config, logger):
+        self.config = config
+        self.logger = logger
+
+        # symbol -> (monotonic receive time, last price)
+        # Written only by the stream task; a dict item read/replace is atomic,
+        # so readers on other threads need no lock.
+        self._prices = {}
+        self.connected = False
+
+    def get_price(self, symbol: str):
+        """Latest streamed price for symbol, or None if unknown or stale"""
+        entry = self._prices.get(symbol)
+        if entry is None:
+            return None
+        received_at, price = entry
+        if time.monotonic() - received_at > self.config.price_stream_max_stale_seconds:
+            return None
+        return price
+
+    def get_prices(self, symbols: list) -> dict:
+        """Fresh streamed prices for symbols: {symbol -> price} (stale/unknown omitted)"""
+        prices = {}
+        for symbol in symbols:
+            price = self.get_price(symbol)
+            if price is not None:
+                prices[symbol] = price
+        return prices
+
+    def _store(self, tickers: dict):
+        """Record the last price of each streamed ticker"""
+        now = time.monotonic()
+        for symbol, ticker in tickers.items():
+            price = ticker.get('last') if ticker else None
+            if price:
+                self._prices[symbol] = (now, price)
+
+    async def run(self, get_symbols, stop_event: asyncio.Event):
+        """
+        Stream tickers for get_symbols() until stop_event is set
+        The symbol list is re-read on every update, so newly opened positions
+        are subscribed without restarting the stream.
+        """
+        try:
+            import ccxt.pro as ccxtpro
+        except ImportError:
+            self.logger.warning("📡 Price stream disabled: ccxt.pro is not available")
+            return
+
+        client = ccxtpro.mexc({'enableRateLimit': True})
+        delay = RECONNECT_MIN_DELAY
+
+        try:
+            while not stop_event.is_set():
+                symbols = sorted(get_symbols())
+                if not symbols:
+                    # Nothing held: idle until a position opens
+                    self._prices.clear()
+                    try:
+                        await asyncio.wait_for(stop_event.wait(), timeout=self.config.position_check_interval_seconds)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                try:
+                    watch = asyncio.ensure_future(client.watch_tickers(symbols))
+                    stop_wait = asyncio.ensure_future(stop_event.wait())
+                    await asyncio.wait({watch, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
+                    if not watch.done():
+                        watch.cancel()
+                        stop_wait.cancel()
+                        break
+                    stop_wait.cancel()
+
+                    self._store(watch.result())
+                    if not self.connected:
+                        self.logger.info(f"📡 Price stream connected ({len(symbols)} symbol(s))")
+                        self.connected = True
+                    delay = RECONNECT_MIN_DELAY
+
+                except Exception as e:
+                    if self.connected:
+                        self.logger.warning(f"📡 Price stream dropped, falling back to REST: {type(e).__name__} - {str(e)[:100]}")
+                    else:
+                        self.logger.debug(f"📡 Price stream connect failed: {type(e).__name__} - {str(e)[:100]}")
+                    self.connected = False
+                    try:
+                        await asyncio.wait_for(stop_event.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    delay = min(delay * 2, RECONNECT_MAX_DELAY)
+        finally:
+            self.connected = False
+            try:
+                await client.close()
+            except Exception:
+                pass
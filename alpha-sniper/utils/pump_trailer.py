@@ -27,7 +27,7 @@ class PumpTrailer:
         self.config = config
         self.logger = logger
 
-    def update(self, position, current_price: float, atr_15m: float) -> bool:
+    def update(self, position, current_price: float, atr_15m: float, now: float = None) -> bool:
         """
         Update trailing stop for a pump position
 
@@ -35,6 +35,7 @@ class PumpTrailer:
             position: Position object with stop_loss, timestamp_open, etc.
             current_price: Current market price
             atr_15m: ATR(14) value from 15m timeframe
+            now: Epoch time of this check (defaults to time.time())
 
         Returns:
             bool: True if stop was updated, False otherwise
@@ -44,7 +45,9 @@ class PumpTrailer:
             return False
 
         # Check if trailing should start (after initial wait period)
-        time_in_position = time.time() - position.get('timestamp_open', time.time())
+        if now is None:
+            now = time.time()
+        time_in_position = now - position.get('timestamp_open', now)
         time_in_minutes = time_in_position / 60
 
         if time_in_minutes < self.config.pump_trail_start_minutes:
@@ -82,12 +85,13 @@ class PumpTrailer:
 
         return False
 
-    def should_trail(self, position) -> bool:
+    def should_trail(self, position, now: float = None) -> bool:
         """
         Check if a position is eligible for trailing
 
         Args:
             position: Position object
+            now: Epoch time of this check (defaults to time.time())
 
         Returns:
             bool: True if position should be trailed
@@ -97,7 +101,9 @@ class PumpTrailer:
             return False
 
         # Check time in position
-        time_in_position = time.time() - position.get('timestamp_open', time.time())
+        if now is None:
+            now = time.time()
+        time_in_position = now - position.get('timestamp_open', now)
         time_in_minutes = time_in_position / 60
 
         return time_in_minutes >= self.config.pump_trail_start_minutes
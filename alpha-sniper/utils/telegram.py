@@ -1,19 +1,66 @@
 """
 Telegram alert module for Alpha Sniper V4.2
 """
+import queue
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from utils.helpers import truncate_message
 
 
+# Messages waiting for the sender thread; beyond this (Telegram down or rate
+# limiting us) new messages are dropped instead of piling up in memory
+SEND_QUEUE_MAXSIZE = 256
+
+# Retries for transient send failures (429, 5xx, timeouts) on the sender thread
+SEND_ATTEMPTS = 3
+SEND_RETRY_BASE_DELAY = 1.0  # seconds, doubled per attempt
+SEND_RETRY_MAX_DELAY = 15.0
+
+# Circuit breaker: after this many messages in a row fail on transient errors, stop
+# calling Telegram for the cooldown and only log; the next message then probes once
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_SECONDS = 60.0
+
+# Telegram flood control allows about one message per second per chat. Sends are
+# spaced this far apart; whatever queues up in the meantime goes out as one message
+SEND_MIN_INTERVAL = 1.0
+COALESCE_SEPARATOR = "\n──────────\n"
+MAX_MESSAGE_LENGTH = 4000
+
+# Keep-alive session for the legacy send_telegram() helper (created on first use)
+_legacy_session = None
+
+
 class TelegramNotifier:
     """
     Simple Telegram notification wrapper
+
+    Messages are queued and POSTed by a background daemon thread, so callers
+    (trading cycle, position loop) never block on Telegram's HTTPS round-trip.
+    The queue is bounded: if delivery stalls, new messages are dropped.
+    Call close() on shutdown to flush what is still queued.
     """
     def __init__(self, config, logger):
         self.config = config
         self.logger = logger
         self.enabled = False
 
+        # Background delivery
+        self._queue = queue.Queue(maxsize=SEND_QUEUE_MAXSIZE)
+        self._worker = None
+        self._dropped = 0
+        self._closed = False
+
+        # Circuit breaker state (touched only by whichever thread is sending)
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0  # monotonic; 0 = closed
+
+        # Persistent HTTPS connection to api.telegram.org (one sender thread -> small pool)
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
         if config.telegram_bot_token and config.telegram_chat_id:
             self.bot_token = config.telegram_bot_token
             self.chat_id = config.telegram_chat_id
@@ -21,47 +68,229 @@ class TelegramNotifier:
             self.logger.info(f"📱 Telegram notifications enabled (chat_id={self.chat_id})")
             # Send test message on startup
             self.send_test_message()
+
+            self._start_worker()
         else:
             self.logger.info("📱 Telegram notifications disabled (no token/chat_id in config)")
 
     def send(self, msg: str, description: str = "Message") -> bool:
         """
-        Send message to Telegram with robust error handling
+        Queue a message for background delivery to Telegram
 
         Args:
             msg: Message text to send
             description: Short description for logging (e.g., "Startup", "Trade Open")
 
         Returns:
-            True if sent successfully, False otherwise
+            True if queued, False if Telegram is disabled or the queue is full
+            (delivery result is logged by the sender thread)
         """
         if not self.enabled:
             return False
 
+        if self._worker is None or not self._worker.is_alive():
+            if self._closed or self._worker is None:
+                # Sender not running (startup or after close) - deliver inline
+                return self._post(msg, description)
+            # Sender thread died: restart it rather than block the caller on HTTPS
+            self.logger.warning("[TELEGRAM] Sender thread not running, restarting it")
+            self._start_worker()
+
+        try:
+            self._queue.put_nowait((msg, description))
+        except queue.Full:
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 50 == 0:
+                self.logger.warning(f"[TELEGRAM] Send queue full, dropped {description} ({self._dropped} dropped so far)")
+            return False
+        return True
+
+    def _start_worker(self):
+        """Start the background sender thread"""
+        self._worker = threading.Thread(target=self._worker_loop, name="telegram-sender", daemon=True)
+        self._worker.start()
+
+    def _worker_loop(self):
+        """
+        Sender thread: drain the queue until the None sentinel arrives
+        An isolated message goes out immediately; during a burst, messages that queue
+        up behind the SEND_MIN_INTERVAL spacing are coalesced into one send.
+        """
+        last_sent = 0.0
+        carry = None  # Message taken off the queue that didn't fit into the previous batch
+        stopping = False
+        while not stopping:
+            item = carry if carry is not None else self._queue.get()
+            carry = None
+            if item is None:
+                return
+            try:
+                wait = SEND_MIN_INTERVAL - (time.monotonic() - last_sent)
+                if wait > 0:
+                    time.sleep(wait)
+
+                # Pick up everything queued meanwhile, up to Telegram's message length
+                msgs, descriptions = [item[0]], [item[1]]
+                length = len(item[0])
+                while True:
+                    try:
+                        nxt = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if nxt is None:
+                        stopping = True
+                        break
+                    length += len(COALESCE_SEPARATOR) + len(nxt[0])
+                    if length > MAX_MESSAGE_LENGTH:
+                        carry = nxt
+                        break
+                    msgs.append(nxt[0])
+                    descriptions.append(nxt[1])
+
+                if len(msgs) == 1:
+                    self._post(item[0], item[1], attempts=SEND_ATTEMPTS)
+                else:
+                    description = f"{len(msgs)} messages ({', '.join(descriptions)})"
+                    sent, rejected = self._deliver(COALESCE_SEPARATOR.join(msgs), description, SEND_ATTEMPTS)
+                    if rejected:
+                        # One part (e.g. bad HTML) sank the batch: send the parts on their
+                        # own so only the broken one is lost
+                        self.logger.warning(f"[TELEGRAM] Batch of {len(msgs)} rejected, sending messages separately")
+                        for part, part_description in zip(msgs, descriptions):
+                            time.sleep(SEND_MIN_INTERVAL)
+                            self._post(part, part_description, attempts=SEND_ATTEMPTS)
+                last_sent = time.monotonic()
+            except Exception as e:
+                self.logger.error(f"[TELEGRAM] ❌ Sender thread error: {type(e).__name__} - {str(e)[:100]}")
+
+    def close(self, timeout: float = 3.0):
+        """
+        Flush queued messages and stop the sender thread
+        Waits at most `timeout` seconds so shutdown can't hang on Telegram.
+        """
+        self._closed = True
+        if self._worker is None or not self._worker.is_alive():
+            return
+
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            self.logger.warning(f"[TELEGRAM] Sender still busy after {timeout:.0f}s, {self._queue.qsize()} message(s) dropped")
+            return
+        self._worker.join(timeout=timeout)
+        if self._worker.is_alive():
+            self.logger.warning(f"[TELEGRAM] Sender still busy after {timeout:.0f}s, {self._queue.qsize()} message(s) dropped")
+            return
+
+        self.session.close()
+
+    def _post(self, msg: str, description: str = "Message", attempts: int = 1) -> bool:
+        """
+        Send message to Telegram synchronously with robust error handling
+        Transient failures (429, 5xx, timeout, connection error) are retried up to
+        `attempts` times with exponential backoff, honouring Telegram's retry_after.
+
+        While the circuit breaker is open (Telegram unreachable) the message is only
+        logged; once the cooldown ends a single attempt probes whether it's back.
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        sent, _ = self._deliver(msg, description, attempts)
+        return sent
+
+    def _deliver(self, msg: str, description: str, attempts: int):
+        """
+        _post with the failure kind
+        Returns: (sent, rejected) - rejected is True when Telegram refused this message
+        itself (e.g. bad HTML), as opposed to Telegram being unreachable
+        """
+        if self._breaker_open_until:
+            if time.monotonic() < self._breaker_open_until:
+                self.logger.warning(f"[TELEGRAM] Circuit open, not sent: {description} - {msg[:200]}")
+                return False, False
+            attempts = 1  # Half-open: probe once
+
+        for attempt in range(attempts):
+            sent, retry_after = self._post_once(msg, description)
+            if sent:
+                self._record_result(True)
+                return True, False
+            if retry_after is None:
+                return False, True  # Rejected (e.g. bad request) - Telegram itself is reachable
+            if attempt == attempts - 1:
+                break
+            retry_delay = min(max(retry_after, SEND_RETRY_BASE_DELAY * 2 ** attempt), SEND_RETRY_MAX_DELAY)
+            self.logger.info(f"[TELEGRAM] Retrying {description} in {retry_delay:.0f}s ({attempt + 2}/{attempts})")
+            time.sleep(retry_delay)
+
+        self._record_result(False)
+        return False, False
+
+    def _record_result(self, sent: bool):
+        """Update the circuit breaker after a message was delivered or failed transiently"""
+        if sent:
+            if self._breaker_open_until:
+                self.logger.info("[TELEGRAM] ✅ Telegram reachable again, circuit closed")
+            self._consecutive_failures = 0
+            self._breaker_open_until = 0.0
+            return
+
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= BREAKER_FAILURE_THRESHOLD:
+            if not self._breaker_open_until:
+                self.logger.warning(
+                    f"[TELEGRAM] {self._consecutive_failures} sends failed in a row, "
+                    f"pausing Telegram for {BREAKER_COOLDOWN_SECONDS:.0f}s (messages are logged only)"
+                )
+            self._breaker_open_until = time.monotonic() + BREAKER_COOLDOWN_SECONDS
+
+    def _post_once(self, msg: str, description: str):
+        """
+        Single sendMessage attempt
+        Returns: (sent, retry_after) - retry_after is None when the failure isn't transient,
+        otherwise the minimum wait in seconds Telegram asked for (0 if it didn't say)
+        """
+        retry_after = None
         try:
-            msg = truncate_message(msg, max_length=4000)
+            msg = truncate_message(msg, max_length=MAX_MESSAGE_LENGTH)
             url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
             payload = {"chat_id": self.chat_id, "text": msg, "parse_mode": "HTML"}
-            resp = requests.post(url, json=payload, timeout=5)
+            resp = self.session.post(url, json=payload, timeout=5)
 
             if resp.status_code == 200:
                 self.logger.info(f"[TELEGRAM] ✅ {description} sent successfully")
-                return True
-            else:
-                self.logger.error(
-                    f"[TELEGRAM] ❌ {description} failed: HTTP {resp.status_code} - {resp.text[:200]}"
-                )
-                return False
+                return True, None
 
+            self.logger.error(
+                f"[TELEGRAM] ❌ {description} failed: HTTP {resp.status_code} - {resp.text[:200]}"
+            )
+            if resp.status_code == 429:
+                retry_after = self._retry_after(resp)
+            elif resp.status_code >= 500:
+                retry_after = 0.0
         except requests.exceptions.Timeout:
             self.logger.error(f"[TELEGRAM] ❌ {description} failed: Request timeout (>5s)")
-            return False
+            retry_after = 0.0
         except requests.exceptions.ConnectionError as e:
             self.logger.error(f"[TELEGRAM] ❌ {description} failed: Connection error - {str(e)[:100]}")
-            return False
+            retry_after = 0.0
         except Exception as e:
             self.logger.error(f"[TELEGRAM] ❌ {description} failed: {type(e).__name__} - {str(e)[:100]}")
-            return False
+
+        return False, retry_after
+
+    @staticmethod
+    def _retry_after(resp) -> float:
+        """Seconds Telegram asked us to wait on a 429 (JSON retry_after or Retry-After header)"""
+        try:
+            return float(resp.json()['parameters']['retry_after'])
+        except Exception:
+            pass
+        try:
+            return float(resp.headers.get('Retry-After', 0))
+        except (TypeError, ValueError):
+            return 0.0
 
     def send_message(self, msg: str) -> bool:
         """
@@ -90,7 +319,7 @@ class TelegramNotifier:
             f"Chat ID: {self.chat_id}\n"
             f"Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
         )
-        result = self.send(msg, description="Test message")
+        result = self._post(msg, description="Test message")
         if result:
             self.logger.info("[TELEGRAM] Test message sent successfully - Telegram is working!")
         else:
@@ -110,10 +339,14 @@ def send_telegram(msg: str):
     if not bot_token or not chat_id:
         return
 
+    global _legacy_session
+    if _legacy_session is None:
+        _legacy_session = requests.Session()
+
     try:
         msg = truncate_message(msg, max_length=4000)
         url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
         payload = {"chat_id": chat_id, "text": msg}
-        requests.post(url, json=payload, timeout=5)
+        _legacy_session.post(url, json=payload, timeout=5)
     except Exception:
         pass
@@ -14,10 +14,15 @@ Usage:
     alert_mgr.send_trade_open(...)
     alert_mgr.send_trade_close(...)
 """
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 
 
+# Digest chunks stay under Telegram's 4096-char limit (TelegramNotifier truncates at 4000)
+DIGEST_MAX_CHARS = 4000
+
+
 class TelegramAlertManager:
     """
     Enhanced Telegram alert manager with detailed, formatted notifications
@@ -42,6 +47,59 @@ class TelegramAlertManager:
         self.day_start_equity = 0.0
         self.last_summary_day = datetime.now(timezone.utc).day
 
+        # Trade open/close alerts collected while a digest() block is active
+        self._digest = None
+
+    @contextmanager
+    def digest(self):
+        """
+        Batch trade open/close alerts into as few messages as possible
+        Alerts raised inside the block are sent together when it exits; other
+        alerts (errors, limits, regime) still go out immediately. Nested blocks
+        join the outermost one.
+        """
+        if self._digest is not None:
+            yield
+            return
+
+        self._digest = []
+        try:
+            yield
+        finally:
+            self._flush_digest()
+
+    def _send_trade_alert(self, msg: str, description: str) -> bool:
+        """
+        Send a trade alert now, or hold it for the active digest
+        Returns: True if held for the digest (sent when the block exits)
+        """
+        if self._digest is not None:
+            self._digest.append((msg, description))
+            return True
+        self.telegram.send(msg, description=description)
+        return False
+
+    def _flush_digest(self):
+        """Send collected trade alerts, packed into messages of at most DIGEST_MAX_CHARS"""
+        alerts, self._digest = self._digest, None
+        if not alerts:
+            return
+
+        if len(alerts) == 1:
+            msg, description = alerts[0]
+            self.telegram.send(msg, description=description)
+            return
+
+        chunks = []
+        for msg, _ in alerts:
+            if chunks and len(chunks[-1]) + 2 + len(msg) <= DIGEST_MAX_CHARS:
+                chunks[-1] += "\n\n" + msg
+            else:
+                chunks.append(msg)
+
+        for i, chunk in enumerate(chunks, 1):
+            self.telegram.send(chunk, description=f"Trade digest {i}/{len(chunks)} ({len(alerts)} alerts)")
+
     def send_startup(self, mode: str, pump_only: bool, data_source: str,
                      equity: float, regime: str):
         """
@@ -169,7 +227,7 @@ class TelegramAlertManager:
 
         msg += f"<b>Time:</b> {datetime.now(timezone.utc).strftime('%H:%M:%S UTC')}\n"
 
-        self.telegram.send(msg, description=f"Trade Open ({symbol} {side})")
+        self._send_trade_alert(msg, description=f"Trade Open ({symbol} {side})")
 
     def send_trade_close(self, symbol: str, side: str, engine: str, regime: str,
                          entry: float, exit_price: float, size: float,
@@ -226,8 +284,10 @@ class TelegramAlertManager:
             f"<b>Time:</b> {datetime.now(timezone.utc).strftime('%H:%M:%S UTC')}\n"
         )
 
-        self.telegram.send(msg, description=f"Trade Close ({symbol} {emoji})")
-        self.logger.info(f"[TELEGRAM] Trade close alert sent: {symbol} {pnl_usd:+.2f} USD")
+        if self._send_trade_alert(msg, description=f"Trade Close ({symbol} {emoji})"):
+            self.logger.info(f"[TELEGRAM] Trade close alert queued for digest: {symbol} {pnl_usd:+.2f} USD")
+        else:
+            self.logger.info(f"[TELEGRAM] Trade close alert sent: {symbol} {pnl_usd:+.2f} USD")
 
         # Update daily stats
         self.daily_trades += 1